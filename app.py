@@ -12,11 +12,28 @@ import json
 import threading
 import time
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import glob
 
 app = Flask(__name__)
 CORS(app)
 
+# Compress JSON/HTML responses when Flask-Compress is installed. Streamed
+# responses (SSE log tails) are left alone so events are not buffered.
+try:
+    from flask_compress import Compress
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['COMPRESS_STREAMS'] = False
+    app.config['COMPRESS_MIMETYPES'] = [
+        'application/json', 'text/html', 'text/css', 'application/javascript', 'text/javascript'
+    ]
+    app.config['COMPRESS_EVALUATE_CONDITIONAL_REQUEST'] = True
+    Compress(app)
+except ImportError:
+    print("Warning: Flask-Compress not installed, responses will not be compressed")
+
 # Configuration
 HOME_DIR = "/opt/cp4i"
 PYTHON_DOWNLOADER = os.path.join(os.path.dirname(__file__), "cp4i_downloader.py")
@@ -2635,42 +2652,77 @@ except Exception as e:
     live_fetcher = None
     LIVE_DATA_ENABLED = False
 
+# The fetcher config is static for the life of the process, so serialize it
+# once here and splice the fragment into /api/live/status responses
+LIVE_CONFIG_JSON = json.dumps(live_fetcher.config) if live_fetcher else None
+
+
+# Parsed local JSON data files keyed by path, invalidated on mtime change
+_json_file_cache = {}
+_json_file_cache_lock = threading.Lock()
+
+
+def _load_json_cached(path):
+    """Load a JSON file, reusing the parsed data until the file is modified"""
+    mtime = os.path.getmtime(path)
+    with _json_file_cache_lock:
+        cached = _json_file_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+    
+    with open(path, 'r') as f:
+        data = json.load(f)
+    
+    with _json_file_cache_lock:
+        _json_file_cache[path] = (mtime, data)
+    return data
+
+
+def _safe_local_fallback(path):
+    """Load a local fallback data file, returning None if it is missing or unreadable"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return _load_json_cached(path)
+    except (OSError, ValueError):
+        return None
+
 
 @app.route('/api/live/versions', methods=['GET'])
 def get_live_versions():
     """Get live version data for all components"""
-    try:
-        if not LIVE_DATA_ENABLED or not live_fetcher:
-            # Fallback to local data
-            with open('sample-versions.json', 'r') as f:
-                return jsonify({
-                    "success": True,
-                    "source": "local",
-                    "data": json.load(f)
-                })
-        
-        # Fetch live data
-        versions = live_fetcher.get_all_component_versions()
-        
-        return jsonify({
-            "success": True,
-            "source": "live",
-            "data": versions,
-            "cached": True
-        })
-    
-    except Exception as e:
-        # Fallback to local data on error
+    if LIVE_DATA_ENABLED and live_fetcher:
         try:
-            with open('sample-versions.json', 'r') as f:
-                return jsonify({
-                    "success": True,
-                    "source": "local_fallback",
-                    "data": json.load(f),
-                    "error": str(e)
-                })
-        except:
-            return jsonify({"error": str(e)}), 500
+            # Fetch live data
+            versions = live_fetcher.get_all_component_versions()
+            
+            return jsonify({
+                "success": True,
+                "source": "live",
+                "data": versions,
+                "cached": True
+            })
+        except Exception as e:
+            # Fallback to local data on error
+            payload = _safe_local_fallback('sample-versions.json')
+            if payload is None:
+                return jsonify({"error": str(e)}), 500
+            return jsonify({
+                "success": True,
+                "source": "local_fallback",
+                "data": payload,
+                "error": str(e)
+            })
+    
+    # Fallback to local data
+    payload = _safe_local_fallback('sample-versions.json')
+    if payload is None:
+        return jsonify({"error": "Local version data not available"}), 500
+    return jsonify({
+        "success": True,
+        "source": "local",
+        "data": payload
+    })
 
 
 @app.route('/api/live/openshift-versions', methods=['GET'])
@@ -2759,53 +2811,97 @@ def get_live_component_versions(component):
 def get_live_support_matrix(component, version):
     """Get live support matrix for a specific component version"""
     try:
-        if not LIVE_DATA_ENABLED or not live_fetcher:
-            # Fallback to local data
-            with open('cp4i_version_data.json', 'r') as f:
-                data = json.load(f)
-                component_data = data.get(component, {})
-                version_data = component_data.get(version, {})
+        if LIVE_DATA_ENABLED and live_fetcher:
+            # Fetch live data
+            matrix = live_fetcher.fetch_component_support_matrix(component, version)
+            
+            if matrix:
                 return jsonify({
                     "success": True,
-                    "source": "local",
+                    "source": "live",
                     "component": component,
                     "version": version,
-                    "data": version_data
+                    "data": matrix,
+                    "cached": True
                 })
-        
-        # Fetch live data
-        matrix = live_fetcher.fetch_component_support_matrix(component, version)
-        
-        if matrix:
-            return jsonify({
-                "success": True,
-                "source": "live",
-                "component": component,
-                "version": version,
-                "data": matrix,
-                "cached": True
-            })
+            source = "local_fallback"
         else:
-            # Fallback to local data
-            with open('cp4i_version_data.json', 'r') as f:
-                data = json.load(f)
-                component_data = data.get(component, {})
-                version_data = component_data.get(version, {})
-                return jsonify({
-                    "success": True,
-                    "source": "local_fallback",
-                    "component": component,
-                    "version": version,
-                    "data": version_data
-                })
+            source = "local"
+        
+        # Fallback to local data (parsed at most once per file modification)
+        data = _load_json_cached('cp4i_version_data.json')
+        return jsonify({
+            "success": True,
+            "source": source,
+            "component": component,
+            "version": version,
+            "data": data.get(component, {}).get(version, {})
+        })
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+# Refresh/clear run on a single background worker so request threads are not
+# blocked; concurrent requests for the same task share the in-flight future.
+# The worker and its futures belong to the process that created them, so a
+# forked WSGI worker starts over with its own (see _live_tasks_for_process).
+_live_executor = None
+_live_pid = None
+_live_tasks = {}
+_live_tasks_lock = threading.Lock()
+
+# Most recent background task failure, reported by /api/live/status
+_live_last_error = None
+
+
+def _live_tasks_for_process():
+    """Reset the executor and task table in a new process; call with _live_tasks_lock held"""
+    global _live_executor, _live_pid
+    if _live_pid != os.getpid():
+        _live_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='live-data')
+        _live_tasks.clear()
+        _live_pid = os.getpid()
+
+
+def _submit_live_task(task_name, func):
+    """Submit a live data task unless the same task is already in flight"""
+    with _live_tasks_lock:
+        _live_tasks_for_process()
+        future = _live_tasks.get(task_name)
+        if future is None or future.done():
+            future = _live_executor.submit(func)
+            future.add_done_callback(lambda f: _record_live_task_result(task_name, f))
+            _live_tasks[task_name] = future
+        return future
+
+
+def _record_live_task_result(task_name, future):
+    """Log and remember the exception of a finished live data task, since nobody waits on it"""
+    global _live_last_error
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        app.logger.error(f"Live data task {task_name} failed: {error}")
+        _live_last_error = {
+            "task": task_name,
+            "error": str(error),
+            "time": datetime.now().isoformat()
+        }
+
+
+def _live_task_running(task_name):
+    """Check whether a live data task is queued or running"""
+    with _live_tasks_lock:
+        _live_tasks_for_process()
+        future = _live_tasks.get(task_name)
+        return future is not None and not future.done()
+
+
 @app.route('/api/live/refresh', methods=['POST'])
 def refresh_live_data():
-    """Manually refresh all live data"""
+    """Manually refresh all live data in the background"""
     try:
         if not LIVE_DATA_ENABLED or not live_fetcher:
             return jsonify({
@@ -2813,14 +2909,14 @@ def refresh_live_data():
                 "error": "Live data fetcher not available"
             }), 503
         
-        # Refresh all data
-        result = live_fetcher.refresh_all_data()
+        # Refresh all data (coalesced with any refresh already in flight)
+        _submit_live_task('refresh', live_fetcher.refresh_all_data)
         
         return jsonify({
             "success": True,
-            "message": "Data refreshed successfully",
-            "data": result
-        })
+            "status": "refreshing",
+            "message": "Data refresh started"
+        }), 202
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -2828,7 +2924,7 @@ def refresh_live_data():
 
 @app.route('/api/live/clear-cache', methods=['POST'])
 def clear_live_cache():
-    """Clear the live data cache"""
+    """Clear the live data cache in the background"""
     try:
         if not LIVE_DATA_ENABLED or not live_fetcher:
             return jsonify({
@@ -2836,40 +2932,51 @@ def clear_live_cache():
                 "error": "Live data fetcher not available"
             }), 503
         
-        # Clear cache
-        live_fetcher.clear_cache()
+        # Clear cache (queued behind any refresh already in flight)
+        _submit_live_task('clear_cache', live_fetcher.clear_cache)
         
         return jsonify({
             "success": True,
-            "message": "Cache cleared successfully"
-        })
+            "status": "clearing",
+            "message": "Cache clear started"
+        }), 202
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+# Static Red Hat operator list served when the live fetcher is unavailable
+FALLBACK_REDHAT_OPERATORS = (
+    {"name": "Red Hat OpenShift Serverless", "package": "serverless-operator", "catalog": "redhat-operators"},
+    {"name": "Red Hat OpenShift Service Mesh", "package": "servicemeshoperator", "catalog": "redhat-operators"},
+    {"name": "Red Hat OpenShift Pipelines", "package": "openshift-pipelines-operator-rh", "catalog": "redhat-operators"},
+    {"name": "Red Hat OpenShift GitOps", "package": "openshift-gitops-operator", "catalog": "redhat-operators"},
+    {"name": "Red Hat OpenShift Logging", "package": "cluster-logging", "catalog": "redhat-operators"},
+    {"name": "Red Hat Integration - AMQ Streams", "package": "amq-streams", "catalog": "redhat-operators"},
+    {"name": "Red Hat Integration - AMQ Broker", "package": "amq-broker-rhel8", "catalog": "redhat-operators"},
+    {"name": "Red Hat OpenShift Data Foundation", "package": "odf-operator", "catalog": "redhat-operators"},
+    {"name": "Red Hat Advanced Cluster Security", "package": "rhacs-operator", "catalog": "redhat-operators"},
+    {"name": "Red Hat Quay", "package": "quay-operator", "catalog": "redhat-operators"}
+)
+
+
+@lru_cache(maxsize=16)
+def _fallback_operators(catalog='redhat-operators', limit=None):
+    """Build (once per catalog/limit) the static fallback operator list"""
+    operators = tuple(op for op in FALLBACK_REDHAT_OPERATORS if op["catalog"] == catalog)
+    return operators[:limit] if limit else operators
+
+
 @app.route('/api/live/redhat-operators', methods=['GET'])
 def get_live_redhat_operators():
     """Get list of available Red Hat operators"""
     try:
         if not LIVE_DATA_ENABLED or not live_fetcher:
             # Return static list as fallback
-            operators = [
-                {"name": "Red Hat OpenShift Serverless", "package": "serverless-operator", "catalog": "redhat-operators"},
-                {"name": "Red Hat OpenShift Service Mesh", "package": "servicemeshoperator", "catalog": "redhat-operators"},
-                {"name": "Red Hat OpenShift Pipelines", "package": "openshift-pipelines-operator-rh", "catalog": "redhat-operators"},
-                {"name": "Red Hat OpenShift GitOps", "package": "openshift-gitops-operator", "catalog": "redhat-operators"},
-                {"name": "Red Hat OpenShift Logging", "package": "cluster-logging", "catalog": "redhat-operators"},
-                {"name": "Red Hat Integration - AMQ Streams", "package": "amq-streams", "catalog": "redhat-operators"},
-                {"name": "Red Hat Integration - AMQ Broker", "package": "amq-broker-rhel8", "catalog": "redhat-operators"},
-                {"name": "Red Hat OpenShift Data Foundation", "package": "odf-operator", "catalog": "redhat-operators"},
-                {"name": "Red Hat Advanced Cluster Security", "package": "rhacs-operator", "catalog": "redhat-operators"},
-                {"name": "Red Hat Quay", "package": "quay-operator", "catalog": "redhat-operators"}
-            ]
             return jsonify({
                 "success": True,
                 "source": "local",
-                "operators": operators
+                "operators": _fallback_operators()
             })
         
         # Fetch live data
@@ -2884,15 +2991,45 @@ def get_live_redhat_operators():
             })
         else:
             # Return static list as fallback
-            operators = [
-                {"name": "Red Hat OpenShift Serverless", "package": "serverless-operator", "catalog": "redhat-operators"},
-                {"name": "Red Hat OpenShift Service Mesh", "package": "servicemeshoperator", "catalog": "redhat-operators"},
-                {"name": "Red Hat OpenShift Pipelines", "package": "openshift-pipelines-operator-rh", "catalog": "redhat-operators"}
-            ]
             return jsonify({
                 "success": True,
                 "source": "local_fallback",
-                "operators": operators
+                "operators": _fallback_operators(limit=3)
+            })
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route('/api/live/case-details/<component>', methods=['GET'])
+def get_all_case_versions_details(component):
+    """Get detailed information for every CASE version of a component from GitHub"""
+    try:
+        if not LIVE_DATA_ENABLED or not live_fetcher:
+            return jsonify({
+                "success": False,
+                "error": "Live data fetcher not available"
+            }), 503
+        
+        # One repository tree listing plus the case.yaml files not cached yet
+        details = live_fetcher.fetch_all_case_versions_details(component)
+        
+        if details:
+            return jsonify({
+                "success": True,
+                "source": "live",
+                "component": component,
+                "details": details,
+                "cached": True
+            })
+        else:
+            # Fallback to local data
+            data = _safe_local_fallback('cp4i_version_data.json') or {}
+            return jsonify({
+                "success": True,
+                "source": "local_fallback",
+                "component": component,
+                "details": data.get(component, {})
             })
     
     except Exception as e:
@@ -2945,7 +3082,9 @@ def get_live_data_status():
     try:
         status = {
             "enabled": LIVE_DATA_ENABLED,
-            "fetcher_available": live_fetcher is not None
+            "fetcher_available": live_fetcher is not None,
+            "refresh_in_progress": _live_task_running('refresh'),
+            "last_error": _live_last_error
         }
         
         if LIVE_DATA_ENABLED and live_fetcher:
@@ -2967,24 +3106,66 @@ def get_live_data_status():
                 "files": cache_files,
                 "total_files": len(cache_files)
             }
-            
-            # Load configuration
-            status["config"] = live_fetcher.config
         
-        return jsonify({
-            "success": True,
-            "status": status
-        })
+        status_json = json.dumps(status)
+        if LIVE_DATA_ENABLED and LIVE_CONFIG_JSON is not None:
+            # Append the pre-serialized config as the last key of the status object
+            status_json = f'{status_json[:-1]}, "config": {LIVE_CONFIG_JSON}}}'
+        
+        return app.response_class(
+            f'{{"success": true, "status": {status_json}}}\n',
+            mimetype='application/json'
+        )
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 
-if __name__ == '__main__':
+def _startup():
+    """One-shot process initialization, run at import so WSGI workers get it too"""
     # Ensure home directory exists
-    os.makedirs(HOME_DIR, exist_ok=True)
+    try:
+        os.makedirs(HOME_DIR, exist_ok=True)
+    except OSError as e:
+        print(f"Warning: Could not create home directory {HOME_DIR}: {e}")
+
+
+# PID of the process whose caches have been warmed
+_warmed_pid = None
+_warm_lock = threading.Lock()
+
+
+@app.before_request
+def _warm_caches_once():
+    """Warm caches on the first request served by each process
     
+    Not done at import: importing the module (tests, the debug reloader's
+    parent, gunicorn --preload before fork) must not start network refreshes.
+    """
+    global _warmed_pid
+    if _warmed_pid == os.getpid():
+        return
+    with _warm_lock:
+        if _warmed_pid == os.getpid():
+            return
+        _warmed_pid = os.getpid()
+    _warm_caches()
+
+
+def _warm_caches():
+    """Pre-load local data files and start a live refresh so first requests hit warm caches"""
+    for path in ('sample-versions.json', 'cp4i_version_data.json'):
+        _safe_local_fallback(path)
+    
+    if LIVE_DATA_ENABLED and live_fetcher and live_fetcher.config.get('cache', {}).get('warm_on_startup', False):
+        _submit_live_task('refresh', live_fetcher.refresh_all_data)
+
+
+_startup()
+
+
+if __name__ == '__main__':
     # Run the app
     app.run(host='0.0.0.0', port=5000, debug=True)
 
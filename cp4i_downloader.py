@@ -9,19 +9,68 @@ import sys
 import json
 import subprocess
 import logging
+from logging.handlers import MemoryHandler
 import time
+import random
 import signal
 import threading
-import requests
+import queue
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 import argparse
 import re
+import shutil
+import shlex
+import mmap
+import io
+import contextlib
+import hashlib
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# requests is imported on first HTTP use so --help and --create-config start fast
+_requests = None
+
+
+def _get_requests():
+    """Import requests on first use"""
+    global _requests
+    if _requests is None:
+        import requests as _requests
+    return _requests
+
+# oc ibm-pak applies --filter with Go's RE2 engine; re2 checks the exact dialect
+try:
+    import re2 as _filter_re_engine
+except ImportError:
+    _filter_re_engine = re
 
 # Script version
 SCRIPT_VERSION = "2.0.0"
 
+# Banner lines, built once
+_BANNER = "=" * 60
+_HEADER = f"{_BANNER}\nCP4I Component Downloader v{SCRIPT_VERSION}\n{_BANNER}"
+
+# Notification delivery limits. close() waits long enough for one notification
+# to exhaust its webhook retries and the email command, after the 250ms
+# coalescing window, so the final COMPLETED/FAILED is not cut off at exit.
+_WEBHOOK_TIMEOUT = (2, 3)
+_WEBHOOK_RETRIES = 1
+_EMAIL_TIMEOUT = 5
+_NOTIFY_CLOSE_TIMEOUT = 0.25 + (_WEBHOOK_RETRIES + 1) * sum(_WEBHOOK_TIMEOUT) + 0.5 + _EMAIL_TIMEOUT
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +80,112 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class _LazyShellCommand:
+    """Render an argv list as a quoted shell string only when a log record is emitted"""
+    __slots__ = ('argv',)
+    
+    def __init__(self, argv: List[str]):
+        self.argv = argv
+    
+    def __str__(self) -> str:
+        return shlex.join(self.argv)
+
+
+# Progress marker emitted by oc image mirror for each blob, matched on raw log bytes
+_BLOB_RE = re.compile(rb'Copying blob')
+
+# Config file keys mapped to the downloader attribute they set and its type
+_CONFIG_KEYS = {
+    'MIN_DISK_SPACE_GB': ('min_disk_space_gb', int),
+    'MAX_RETRIES': ('max_retries', int),
+    'RETRY_BASE_DELAY': ('retry_base_delay', int),
+    'RETRY_MAX_DELAY': ('retry_max_delay', int),
+    'COMMAND_TIMEOUT': ('command_timeout', int),
+    'MAX_PARALLEL_DOWNLOADS': ('max_parallel_downloads', int),
+    'MAX_REGISTRY': ('max_registry', int),
+    'CP4I_WEBHOOK_URL': ('webhook_url', str),
+    'CP4I_NOTIFICATION_EMAIL': ('notification_email', str),
+}
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    """Parse KEY=VALUE pairs from a config file
+    
+    mtime_ns and size are only part of the cache key, so an edited file is
+    parsed again while repeat loads of an unchanged file are free.
+    """
+    settings = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                settings.append((key.strip(), value.strip().strip('"').strip("'")))
+    return tuple(settings)
+
+
+# Serializes read-modify-write of the cache files under the downloader home;
+# parallel components run one downloader per thread against the same files
+_cache_file_lock = threading.Lock()
+
+
+# Parallel components share one auth file and one IBMPAK_HOME: logins and
+# oc ibm-pak config/get run one at a time, and the repository is configured
+# once per IBMPAK_HOME
+_registry_login_lock = threading.Lock()
+_ibmpak_lock = threading.Lock()
+_configured_ibmpak_homes = set()
+
+
+def _atomic_write_json(path: str, data: Any) -> None:
+    """Write data as JSON to a temp file and rename it over path, so readers never see a partial file"""
+    # Unique per thread as well as per process
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=16)
+def _disk_free_bytes(path: str, time_window: int) -> int:
+    """Free bytes on the filesystem holding path (time_window only keys the cache)"""
+    return shutil.disk_usage(path).free
+
+
+@lru_cache(maxsize=1024)
+def _path_exists(path: str) -> bool:
+    """os.path.exists for paths probed once per process, such as default auth file locations"""
+    return os.path.exists(path)
+
+
+def _count_mapping_entries(mapping_file: str) -> int:
+    """Count non-empty, non-comment lines in a mapping file with a single byte scan"""
+    with open(mapping_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            count = 0
+            start = 0
+            end = len(mm)
+            while start < end:
+                newline = mm.find(b'\n', start)
+                if newline < 0:
+                    newline = end
+                line = mm[start:newline].strip()
+                if line and not line.startswith(b'#'):
+                    count += 1
+                start = newline + 1
+            return count
+
+
 class CP4IDownloader:
     """Enhanced Python implementation of CP4I component downloader"""
     
@@ -39,15 +194,20 @@ class CP4IDownloader:
         self.ibmpak_home = home_dir
         self.verbose = verbose
         self.config_file = os.path.join(home_dir, ".cp4i-downloader.conf")
+        self.logger = logger
         
         # Configuration defaults
         self.min_disk_space_gb = 100
         self.max_retries = 3
         self.retry_base_delay = 5
+        self.retry_max_delay = 60
+        self.command_timeout = 1800
         self.max_parallel_downloads = 2
+        self.max_registry = None
         
         # Runtime tracking
         self.start_time = datetime.now()
+        self._start_iso = self.start_time.isoformat()
         self.download_start_time = None
         self.total_images = 0
         self.failed_images = []
@@ -55,62 +215,143 @@ class CP4IDownloader:
         self.progress_monitor_thread = None
         self.stop_monitoring = False
         
+        # Index of CASE bundles fetched by previous runs
+        self.fetch_cache_ttl = 86400
+        self.fetch_cache_file = os.path.join(home_dir, ".fetch-cache.json")
+        
+        # Generated mirror manifests, one record per generation parameter set
+        self.manifest_cache_dir = os.path.join(home_dir, ".manifest_cache")
+        
+        # Short non-secret ID of the entitlement key in use, for log/notification correlation
+        self._ek_fp = None
+        
+        # Registry auth results, keyed by registry and entitlement key hash
+        self.auth_cache_ttl = 3000
+        self._auth_cache_path = os.path.join(home_dir, ".auth_cache.json")
+        
+        # GitHub connectivity cache (stale-while-revalidate)
+        self.github_access_ttl = 300
+        self.github_access_cache_file = os.path.join(home_dir, ".github-access.cache")
+        self._github_access = None
+        self._github_refresh_thread = None
+        self._github_lock = threading.Lock()
+        
         # Notification settings
         self.webhook_url = os.environ.get('CP4I_WEBHOOK_URL', '')
         self.notification_email = os.environ.get('CP4I_NOTIFICATION_EMAIL', '')
         
+        # Shared HTTP session, created on first use (see _http_session)
+        self._session = None
+        self._session_lock = threading.Lock()
+        
+        # Notification worker, started with the first queued notification
+        self._notify_queue = queue.Queue()
+        self._notify_thread = None
+        self._notify_lock = threading.Lock()
+        
+        # Running oc image mirror process, so stop() can terminate it
+        self._mirror_process = None
+        
+        # Set by stop(); download_component checks it between steps
+        self._cancelled = threading.Event()
+        
+        # Environment for child commands, built once instead of on every retry
+        self._child_env = {**os.environ, 'IBMPAK_HOME': self.ibmpak_home}
+        
         # Ensure home directory exists
         Path(home_dir).mkdir(parents=True, exist_ok=True)
+        self._created_dirs = {home_dir}
         
         # Load configuration file if exists
         self.load_config_file()
+    
+    def close(self):
+        """Flush queued notifications (waiting at most _NOTIFY_CLOSE_TIMEOUT) and release pooled HTTP connections"""
+        with self._notify_lock:
+            if self._notify_thread is not None:
+                self._notify_queue.put(None)
+                self._notify_thread.join(timeout=_NOTIFY_CLOSE_TIMEOUT)
+                if self._notify_thread.is_alive():
+                    # The daemon worker dies at exit with whatever it still holds
+                    self.logger.warning(
+                        f"Notifications still being delivered after {_NOTIFY_CLOSE_TIMEOUT:.0f}s; "
+                        "any not yet sent are dropped at exit"
+                    )
+                self._notify_thread = None
+        if self._session is not None:
+            self._session.close()
+    
+    def _http_session(self):
+        """Shared HTTP session so GitHub probes and webhooks reuse connections
         
-        # Setup signal handlers for cleanup
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        Probes fail fast; webhook posts retry transient errors in the background.
+        """
+        with self._session_lock:
+            if self._session is None:
+                requests = _get_requests()
+                from requests.adapters import HTTPAdapter
+                from urllib3.util import Retry
+                
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                if self.webhook_url:
+                    session.mount(self.webhook_url, HTTPAdapter(
+                        pool_connections=1,
+                        pool_maxsize=1,
+                        max_retries=Retry(
+                            total=_WEBHOOK_RETRIES,
+                            backoff_factor=0.2,
+                            status_forcelist=[429, 502, 503, 504],
+                            allowed_methods=frozenset({'POST'})
+                        )
+                    ))
+                self._session = session
+            return self._session
     
-    def _signal_handler(self, signum, frame):
-        """Handle cleanup on signal"""
-        logger.info("Received signal, cleaning up...")
+    def stop(self):
+        """Cancel the download: no further steps start, and a running image mirror and the progress monitor are stopped
+        
+        Called on SIGINT/SIGTERM.
+        """
+        self.logger.info("Received signal, cleaning up...")
+        self._cancelled.set()
+        process = self._mirror_process
+        if process is not None and process.poll() is None:
+            process.terminate()
         self.stop_progress_monitor()
-        sys.exit(1)
+    
+    def _cancelled_step(self, result: Dict) -> bool:
+        """True, with a message on result, if stop() was called; checked before each download step"""
+        if not self._cancelled.is_set():
+            return False
+        self.logger.warning("Download cancelled")
+        result['messages'].append("Download cancelled")
+        return True
     
     def log_debug(self, msg: str):
         """Log debug message if verbose mode is enabled"""
         if self.verbose:
-            logger.debug(msg)
+            self.logger.debug(msg)
     
     def load_config_file(self):
         """Load configuration from file"""
         if os.path.exists(self.config_file):
-            logger.info(f"Loading configuration from {self.config_file}")
+            self.logger.info(f"Loading configuration from {self.config_file}")
             try:
-                with open(self.config_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            if '=' in line:
-                                key, value = line.split('=', 1)
-                                key = key.strip()
-                                value = value.strip().strip('"').strip("'")
-                                
-                                # Set configuration values
-                                if key == 'MIN_DISK_SPACE_GB':
-                                    self.min_disk_space_gb = int(value)
-                                elif key == 'MAX_RETRIES':
-                                    self.max_retries = int(value)
-                                elif key == 'RETRY_BASE_DELAY':
-                                    self.retry_base_delay = int(value)
-                                elif key == 'MAX_PARALLEL_DOWNLOADS':
-                                    self.max_parallel_downloads = int(value)
-                                elif key == 'CP4I_WEBHOOK_URL':
-                                    self.webhook_url = value
-                                elif key == 'CP4I_NOTIFICATION_EMAIL':
-                                    self.notification_email = value
+                st = os.stat(self.config_file)
+                settings = _parse_config_file(self.config_file, st.st_mtime_ns, st.st_size)
+                
+                for key, value in settings:
+                    # Set configuration values
+                    if key in _CONFIG_KEYS:
+                        attr, cast = _CONFIG_KEYS[key]
+                        setattr(self, attr, cast(value))
                 
-                logger.info("Configuration loaded successfully")
+                self.logger.info("Configuration loaded successfully")
             except Exception as e:
-                logger.warning(f"Failed to load configuration: {e}")
+                self.logger.warning(f"Failed to load configuration: {e}")
         else:
             self.log_debug(f"No configuration file found at {self.config_file}")
     
@@ -128,6 +369,8 @@ class CP4IDownloader:
 
 # Performance Settings
 #MAX_PARALLEL_DOWNLOADS=2
+# Registries mirrored from concurrently (oc image mirror default: 4)
+#MAX_REGISTRY=4
 
 # Disk Space Requirements (GB)
 #MIN_DISK_SPACE_GB=100
@@ -135,69 +378,133 @@ class CP4IDownloader:
 # Retry Settings
 #MAX_RETRIES=3
 #RETRY_BASE_DELAY=5
+#RETRY_MAX_DELAY=60
+
+# Timeout for each oc ibm-pak / podman command attempt (seconds)
+#COMMAND_TIMEOUT=1800
 """
         try:
             with open(self.config_file, 'w') as f:
                 f.write(config_content)
-            logger.info(f"Sample configuration created at {self.config_file}")
+            self.logger.info(f"Sample configuration created at {self.config_file}")
             return True
         except Exception as e:
-            logger.error(f"Failed to create configuration file: {e}")
+            self.logger.error(f"Failed to create configuration file: {e}")
             return False
     
     def check_prerequisites(self) -> Tuple[bool, List[str]]:
         """Check if all required tools are installed"""
-        logger.info("Validating prerequisites...")
+        self.logger.info("Validating prerequisites...")
         required_tools = ['oc', 'podman', 'curl', 'jq']
-        missing = []
         
-        for tool in required_tools:
-            result = subprocess.run(
-                ['which', tool],
-                capture_output=True,
-                text=True
+        # Check oc ibm-pak plugin in the background while PATH is scanned
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ibmpak_check = executor.submit(
+                subprocess.run,
+                ['oc', 'ibm-pak', '--version'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=self._child_env,
+                timeout=30
             )
-            if result.returncode != 0:
-                missing.append(tool)
-        
-        # Check oc ibm-pak plugin
-        result = subprocess.run(
-            ['oc', 'ibm-pak', '--version'],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            missing.append('oc-ibm-pak')
+            
+            missing = [tool for tool in required_tools if shutil.which(tool) is None]
+            
+            try:
+                if ibmpak_check.result().returncode != 0:
+                    missing.append('oc-ibm-pak')
+            except (OSError, subprocess.TimeoutExpired):
+                missing.append('oc-ibm-pak')
         
         if len(missing) == 0:
-            logger.info("✓ All prerequisites validated")
+            self.logger.info("✓ All prerequisites validated")
             return (True, [])
         else:
-            logger.error(f"Missing required commands: {', '.join(missing)}")
+            self.logger.error(f"Missing required commands: {', '.join(missing)}")
             return (False, missing)
     
     def check_disk_space(self, path: str) -> Tuple[bool, int]:
         """Check available disk space"""
-        logger.info("Checking available disk space...")
+        self.logger.info("Checking available disk space...")
         try:
-            stat = os.statvfs(path)
-            available_gb = (stat.f_bavail * stat.f_frsize) // (1024**3)
+            # Repeat checks of the same path within a 5 second window share one statvfs
+            free_bytes = _disk_free_bytes(path, int(time.monotonic() / 5))
+            available_gb = free_bytes // (1024**3)
             
-            self.log_debug(f"Available space: {available_gb}GB, Required: {self.min_disk_space_gb}GB")
+            self.log_debug(f"Available space: {free_bytes / (1024**3):.2f}GB, Required: {self.min_disk_space_gb}GB")
             
-            if available_gb >= self.min_disk_space_gb:
-                logger.info(f"✓ Disk space check passed ({available_gb}GB available)")
+            if free_bytes >= self.min_disk_space_gb * (1024**3):
+                self.logger.info(f"✓ Disk space check passed ({available_gb}GB available)")
                 return (True, available_gb)
             else:
-                logger.error(f"Insufficient disk space. Available: {available_gb}GB, Required: {self.min_disk_space_gb}GB")
+                self.logger.error(f"Insufficient disk space. Available: {available_gb}GB, Required: {self.min_disk_space_gb}GB")
                 return (False, available_gb)
         except Exception as e:
-            logger.error(f"Failed to check disk space: {e}")
+            self.logger.error(f"Failed to check disk space: {e}")
             return (False, 0)
     
     def check_github_access(self) -> bool:
+        """Check GitHub connectivity, reusing a recent result when available
+        
+        A result younger than github_access_ttl seconds is returned as is. An
+        older one is still returned immediately while a background thread
+        re-probes. Results are persisted under home_dir so later runs share them.
+        """
+        with self._github_lock:
+            cached = self._github_access or self._read_github_access_cache()
+            self._github_access = cached
+        
+        if cached:
+            checked_at, accessible = cached
+            if time.time() - checked_at < self.github_access_ttl:
+                self.log_debug(f"Using cached GitHub connectivity result: {accessible}")
+            else:
+                self.log_debug("Cached GitHub connectivity result is stale, refreshing in background")
+                self._refresh_github_access_async()
+            self.logger.info(f"GitHub {'is' if accessible else 'is not'} accessible (cached)")
+            return accessible
+        
+        return self._update_github_access()
+    
+    def _refresh_github_access_async(self):
+        """Re-probe GitHub in a daemon thread unless a refresh is already running"""
+        with self._github_lock:
+            if self._github_refresh_thread and self._github_refresh_thread.is_alive():
+                return
+            self._github_refresh_thread = threading.Thread(
+                target=self._update_github_access,
+                daemon=True
+            )
+            self._github_refresh_thread.start()
+    
+    def _update_github_access(self) -> bool:
+        """Probe GitHub and store the result in memory and on disk"""
+        accessible = self._probe_github_access()
+        cached = (time.time(), accessible)
+        
+        with self._github_lock:
+            self._github_access = cached
+        
+        with _cache_file_lock:
+            try:
+                _atomic_write_json(self.github_access_cache_file, {'checked_at': cached[0], 'accessible': accessible})
+            except OSError as e:
+                self.log_debug(f"Failed to write GitHub access cache: {e}")
+        
+        return accessible
+    
+    def _read_github_access_cache(self) -> Optional[Tuple[float, bool]]:
+        """Read the persisted GitHub connectivity result, if any"""
+        try:
+            with open(self.github_access_cache_file, 'r') as f:
+                data = json.load(f)
+            return (float(data['checked_at']), bool(data['accessible']))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _probe_github_access(self) -> bool:
         """Check GitHub connectivity"""
-        logger.info("Checking GitHub connectivity...")
+        self.logger.info("Checking GitHub connectivity...")
         
         endpoints = [
             "https://github.com",
@@ -205,25 +512,35 @@ class CP4IDownloader:
             "https://raw.githubusercontent.com"
         ]
         
-        for endpoint in endpoints:
-            try:
-                response = requests.head(endpoint, timeout=5)
+        # Probe all endpoints concurrently and stop at the first that answers
+        session = self._http_session()
+        executor = ThreadPoolExecutor(max_workers=len(endpoints))
+        try:
+            futures = {
+                executor.submit(session.head, endpoint, timeout=5): endpoint
+                for endpoint in endpoints
+            }
+            for future in as_completed(futures):
+                try:
+                    response = future.result()
+                except _get_requests().exceptions.RequestException:
+                    continue
                 if response.status_code < 500:
-                    logger.info(f"✓ GitHub is accessible via {endpoint}")
+                    self.logger.info(f"✓ GitHub is accessible via {futures[future]}")
                     return True
-            except:
-                continue
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        logger.warning("GitHub is not accessible")
+        self.logger.warning("GitHub is not accessible")
         return False
     
     def configure_ibmpak_repo(self) -> bool:
         """Configure oc ibm-pak to use appropriate repository"""
         if self.check_github_access():
-            logger.info("Using default GitHub repository for ibm-pak")
+            self.logger.info("Using default GitHub repository for ibm-pak")
             return True
         else:
-            logger.info("Configuring ibm-pak to use OCI registry (cp.icr.io)")
+            self.logger.info("Configuring ibm-pak to use OCI registry (cp.icr.io)")
             try:
                 result = subprocess.run(
                     [
@@ -232,179 +549,293 @@ class CP4IDownloader:
                         '-r', 'oci:cp.icr.io/cpopen',
                         '--enable'
                     ],
-                    capture_output=True,
-                    text=True
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    env=self._child_env,
+                    timeout=60
                 )
                 
                 if result.returncode == 0:
-                    logger.info("✓ OCI registry configured successfully")
+                    self.logger.info("✓ OCI registry configured successfully")
                     return True
                 else:
-                    logger.warning(f"Failed to configure OCI registry: {result.stderr}")
-                    logger.warning("Attempting to continue...")
+                    self.logger.warning(f"Failed to configure OCI registry: {result.stderr}")
+                    self.logger.warning("Attempting to continue...")
                     return False
             except Exception as e:
-                logger.error(f"Repository configuration error: {e}")
+                self.logger.error(f"Repository configuration error: {e}")
                 return False
     
-    def retry_with_backoff(self, command: List[str], max_attempts: int = None) -> bool:
-        """Execute command with retry logic and exponential backoff"""
+    def retry_with_backoff(self, command: List[str], max_attempts: int = None, log_command: List[str] = None) -> bool:
+        """Execute command with retry logic and exponential backoff
+        
+        Delays use decorrelated jitter (each wait is drawn between the base delay
+        and three times the previous wait, capped at retry_max_delay) so parallel
+        downloaders do not retry against the registry in lockstep. log_command,
+        when given, is what gets logged instead of command (e.g. with secrets masked).
+        """
         if max_attempts is None:
             max_attempts = self.max_retries
         
         delay = self.retry_base_delay
+        shell_command = _LazyShellCommand(log_command or command)
         
         for attempt in range(1, max_attempts + 1):
-            logger.info(f"Attempt {attempt}/{max_attempts}: {' '.join(command)}")
+            if self._cancelled.is_set():
+                self.logger.warning("Cancelled, not running: %s", shell_command)
+                return False
+            self.logger.info("Attempt %d/%d: %s", attempt, max_attempts, shell_command)
             
             try:
                 result = subprocess.run(
                     command,
-                    capture_output=True,
-                    text=True,
-                    env={**os.environ, 'IBMPAK_HOME': self.ibmpak_home}
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=self._child_env,
+                    timeout=self.command_timeout
                 )
                 
                 if result.returncode == 0:
-                    logger.info(f"✓ Command succeeded on attempt {attempt}")
+                    self.logger.info(f"✓ Command succeeded on attempt {attempt}")
                     return True
                 
                 if attempt < max_attempts:
-                    logger.warning(f"Command failed. Retrying in {delay}s...")
-                    time.sleep(delay)
-                    delay *= 2  # Exponential backoff
+                    delay = min(self.retry_max_delay, random.uniform(self.retry_base_delay, delay * 3))
+                    self.logger.warning(f"Command failed. Retrying in {delay:.1f}s...")
+                    # Returns early if stop() is called while waiting
+                    self._cancelled.wait(delay)
             
             except Exception as e:
-                logger.error(f"Command execution error: {e}")
+                self.logger.error(f"Command execution error: {e}")
                 if attempt < max_attempts:
-                    time.sleep(delay)
-                    delay *= 2
+                    delay = min(self.retry_max_delay, random.uniform(self.retry_base_delay, delay * 3))
+                    self._cancelled.wait(delay)
         
-        logger.error(f"Command failed after {max_attempts} attempts")
+        self.logger.error(f"Command failed after {max_attempts} attempts")
         return False
     
-    def authenticate_registry(self, entitlement_key: Optional[str] = None, registry_auth_file: Optional[str] = None) -> bool:
-        """Authenticate to IBM Container Registry with retry logic"""
-        logger.info("Authenticating to IBM registry...")
+    def authenticate_registry(
+        self,
+        entitlement_key: Optional[str] = None,
+        registry_auth_file: Optional[str] = None,
+        force: bool = False
+    ) -> bool:
+        """Authenticate to IBM Container Registry with retry logic
+        
+        With force and an entitlement key, podman login runs even when existing
+        credentials are found.
+        """
+        self.logger.info("Authenticating to IBM registry...")
         
         # Get auth file path
         if not registry_auth_file:
-            registry_auth_file = os.environ.get('REGISTRY_AUTH_FILE', '/root/.docker/config.json')
+            registry_auth_file = self._child_env.get('REGISTRY_AUTH_FILE', '/root/.docker/config.json')
+        
+        if force and entitlement_key:
+            return self._podman_login(entitlement_key)
         
         # First, check if already authenticated via podman
         check_cmd = ['podman', 'login', '--get-login', 'cp.icr.io']
         try:
-            result = subprocess.run(check_cmd, capture_output=True, text=True, timeout=5)
+            result = subprocess.run(check_cmd, capture_output=True, text=True, env=self._child_env, timeout=5)
             if result.returncode == 0 and result.stdout.strip():
-                logger.info(f"✓ Already authenticated to cp.icr.io as {result.stdout.strip()}")
+                self.logger.info(f"✓ Already authenticated to cp.icr.io as {result.stdout.strip()}")
                 return True
         except Exception as e:
             self.log_debug(f"Podman auth check failed: {e}")
         
-        # Check if auth file exists and has cp.icr.io credentials
-        if os.path.exists(registry_auth_file):
-            try:
-                with open(registry_auth_file, 'r') as f:
-                    auth_data = json.load(f)
-                    auths = auth_data.get('auths', {})
-                    if 'cp.icr.io' in auths or 'https://cp.icr.io' in auths:
-                        logger.info(f"✓ Found existing credentials in {registry_auth_file}")
-                        logger.info("✓ Registry authentication successful (using existing credentials)")
-                        return True
-            except Exception as e:
-                self.log_debug(f"Failed to read auth file: {e}")
+        # Check if auth file exists and has cp.icr.io credentials; opening it
+        # directly doubles as the existence check
+        try:
+            with open(registry_auth_file, 'rb') as f:
+                auth_data = _json_loads(f.read())
+                auths = auth_data.get('auths', {})
+                if 'cp.icr.io' in auths or 'https://cp.icr.io' in auths:
+                    self.logger.info(f"✓ Found existing credentials in {registry_auth_file}")
+                    self.logger.info("✓ Registry authentication successful (using existing credentials)")
+                    return True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.log_debug(f"Failed to read auth file: {e}")
         
         # If entitlement key provided, use it to authenticate
         if entitlement_key:
-            cmd = ['podman', 'login', 'cp.icr.io', '-u', 'cp', '-p', entitlement_key]
-            if self.retry_with_backoff(cmd, 3):
-                logger.info("✓ Registry authentication successful")
-                return True
-            else:
-                logger.error("Registry authentication failed with entitlement key")
-                return False
+            return self._podman_login(entitlement_key)
         
         # No entitlement key and no existing credentials
-        logger.warning("No entitlement key provided and no existing credentials found")
-        logger.info("Attempting to proceed - authentication may be required during image pull")
-        logger.info("If download fails, please provide entitlement key via:")
-        logger.info("  1. --entitlement-key argument")
-        logger.info("  2. CP4I_ENTITLEMENT_KEY environment variable")
-        logger.info("  3. Or authenticate manually: podman login cp.icr.io -u cp")
+        self.logger.warning("No entitlement key provided and no existing credentials found")
+        self.logger.info("Attempting to proceed - authentication may be required during image pull")
+        self.logger.info("If download fails, please provide entitlement key via:")
+        self.logger.info("  1. --entitlement-key argument")
+        self.logger.info("  2. CP4I_ENTITLEMENT_KEY environment variable")
+        self.logger.info("  3. Or authenticate manually: podman login cp.icr.io -u cp")
         
         # Return True to allow the process to continue - oc image mirror will handle auth
         return True
     
+    def _podman_login(self, entitlement_key: str) -> bool:
+        """podman login to cp.icr.io with the entitlement key, retried; the key is masked in logs"""
+        cmd = ['podman', 'login', 'cp.icr.io', '-u', 'cp', '-p', entitlement_key]
+        masked_cmd = cmd[:-1] + [f"<entitlement-key {self._ek_fp or 'redacted'}>"]
+        if self.retry_with_backoff(cmd, 3, log_command=masked_cmd):
+            self.logger.info("✓ Registry authentication successful")
+            return True
+        self.logger.error("Registry authentication failed with entitlement key")
+        return False
+    
+    def _auth_cache_key(self, entitlement_key: Optional[str], registry: str = 'cp.icr.io') -> str:
+        """Cache key for a registry login; the entitlement key is only stored hashed"""
+        key_hash = hashlib.sha256((entitlement_key or '').encode()).hexdigest()
+        return f"{registry}:{key_hash}"
+    
+    def _read_auth_cache(self) -> Dict:
+        """Read the registry auth cache, or an empty one if missing or corrupt"""
+        try:
+            with open(self._auth_cache_path, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _auth_cached(self, auth_cache: Dict, cache_key: str, registry_auth_file: str) -> bool:
+        """True if a previous login is within auth_cache_ttl and the auth file is unchanged"""
+        entry = auth_cache.get(cache_key)
+        if not entry:
+            return False
+        try:
+            fresh = time.time() - entry['ts'] < self.auth_cache_ttl
+            unchanged = os.stat(registry_auth_file).st_mtime_ns == entry['mtime_ns']
+        except (OSError, KeyError, TypeError):
+            return False
+        return fresh and unchanged
+    
+    def _update_auth_cache(self, cache_key: str, registry_auth_file: str):
+        """Record a successful login, replacing the cache file atomically"""
+        try:
+            mtime_ns = os.stat(registry_auth_file).st_mtime_ns
+        except OSError:
+            # Nothing on disk to validate against next time
+            return
+        
+        with _cache_file_lock:
+            auth_cache = self._read_auth_cache()
+            auth_cache[cache_key] = {'ts': time.time(), 'mtime_ns': mtime_ns}
+            try:
+                _atomic_write_json(self._auth_cache_path, auth_cache)
+            except OSError as e:
+                self.log_debug(f"Failed to update auth cache: {e}")
+    
     def send_notification(self, status: str, message: str, component: str = "", version: str = ""):
-        """Send notification via webhook or email"""
-        timestamp = datetime.now().isoformat()
+        """Queue a notification for delivery via webhook or email
         
+        Delivery happens on a background thread so the download never waits on
+        webhook latency; close() gives queued notifications _NOTIFY_CLOSE_TIMEOUT to go out.
+        """
+        if self.webhook_url or self.notification_email:
+            with self._notify_lock:
+                if self._notify_thread is None:
+                    self._notify_thread = threading.Thread(target=self._notification_worker, name='notify', daemon=True)
+                    self._notify_thread.start()
+            self._notify_queue.put((status, message, component, version, datetime.now().isoformat()))
+    
+    def _notification_worker(self):
+        """Deliver queued notifications until close() enqueues None
+        
+        A notification followed within 250ms by another with the same status
+        for the same component is superseded by it, so bursts send only once.
+        """
+        no_item = object()
+        item = self._notify_queue.get()
+        while item is not None:
+            try:
+                next_item = self._notify_queue.get(timeout=0.25)
+            except queue.Empty:
+                next_item = no_item
+            
+            if next_item is not no_item and next_item is not None and next_item[0] == item[0] and next_item[2:4] == item[2:4]:
+                item = next_item
+                continue
+            
+            self._deliver_notification(*item)
+            item = self._notify_queue.get() if next_item is no_item else next_item
+    
+    def _deliver_notification(self, status: str, message: str, component: str, version: str, timestamp: str):
+        """Send one notification on every configured channel"""
         # Webhook notification
         if self.webhook_url:
-            try:
-                payload = {
-                    'status': status,
-                    'component': component,
-                    'version': version,
-                    'message': message,
-                    'timestamp': timestamp
-                }
-                requests.post(self.webhook_url, json=payload, timeout=5)
-                self.log_debug("Webhook notification sent")
-            except Exception as e:
-                logger.warning(f"Failed to send webhook notification: {e}")
+            payload = {
+                'status': status,
+                'component': component,
+                'version': version,
+                'message': message,
+                'timestamp': timestamp
+            }
+            if self._ek_fp:
+                payload['ek_fp'] = self._ek_fp
+            self._send_webhook(payload)
         
         # Email notification (requires mail command)
         if self.notification_email:
-            try:
-                subject = f"CP4I Download {status}: {component} v{version}"
-                subprocess.run(
-                    ['mail', '-s', subject, self.notification_email],
-                    input=message.encode(),
-                    timeout=10
-                )
-                self.log_debug("Email notification sent")
-            except Exception as e:
-                logger.warning(f"Failed to send email notification: {e}")
+            self._send_email(f"CP4I Download {status}: {component} v{version}", message)
+    
+    def _send_webhook(self, payload: Dict):
+        """Post a notification payload to the configured webhook"""
+        try:
+            self._http_session().post(self.webhook_url, json=payload, timeout=_WEBHOOK_TIMEOUT)
+            self.log_debug("Webhook notification sent")
+        except Exception as e:
+            self.logger.warning(f"Failed to send webhook notification: {e}")
+    
+    def _send_email(self, subject: str, message: str):
+        """Send a notification email with the mail command"""
+        try:
+            subprocess.run(
+                ['mail', '-s', subject, self.notification_email],
+                input=message.encode(),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=_EMAIL_TIMEOUT
+            )
+            self.log_debug("Email notification sent")
+        except Exception as e:
+            self.logger.warning(f"Failed to send email notification: {e}")
     
     def track_progress(self, mapping_file: str, log_file: str):
-        """Start background progress monitoring"""
+        """Start background progress monitoring
+        
+        Progress is counted from the mirror log that mirror_images derives
+        from log_file, which is where oc image mirror reports copied blobs.
+        """
         if not os.path.exists(mapping_file):
-            logger.warning("Mapping file not found for progress tracking")
+            self.logger.warning("Mapping file not found for progress tracking")
             return
         
         try:
-            with open(mapping_file, 'r') as f:
-                content = f.read()
-                # Count lines that look like image references
-                # Format: file://... or cp.icr.io/...
-                lines = content.strip().split('\n')
-                self.total_images = 0
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        # Count non-empty, non-comment lines
-                        self.total_images += 1
-                
-            logger.info(f"Total images to download: {self.total_images}")
+            # Count lines that look like image references
+            # Format: file://... or cp.icr.io/...
+            self.total_images = _count_mapping_entries(mapping_file)
+            
+            self.logger.info(f"Total images to download: {self.total_images}")
             
             # Log first few lines for debugging
             if self.total_images == 0:
-                logger.warning("Mapping file appears to be empty or has no valid entries")
-                logger.info(f"Mapping file location: {mapping_file}")
+                self.logger.warning("Mapping file appears to be empty or has no valid entries")
+                self.logger.info(f"Mapping file location: {mapping_file}")
                 try:
                     with open(mapping_file, 'r') as f:
                         first_lines = f.readlines()[:5]
                         if first_lines:
-                            logger.info("First 5 lines of mapping file:")
+                            self.logger.info("First 5 lines of mapping file:")
                             for line in first_lines:
-                                logger.info(f"  {line.rstrip()}")
+                                self.logger.info(f"  {line.rstrip()}")
                         else:
-                            logger.warning("Mapping file is completely empty")
+                            self.logger.warning("Mapping file is completely empty")
                 except:
                     pass
         except Exception as e:
-            logger.warning(f"Failed to count images: {e}")
+            self.logger.warning(f"Failed to count images: {e}")
             return
         
         # Start progress monitor thread only if there are images
@@ -412,26 +843,84 @@ class CP4IDownloader:
             self.stop_monitoring = False
             self.progress_monitor_thread = threading.Thread(
                 target=self._progress_monitor,
-                args=(log_file,),
+                args=(log_file.replace('-download.log', '-mirror.log'),),
                 daemon=True
             )
             self.progress_monitor_thread.start()
     
     def _progress_monitor(self, log_file: str):
-        """Background thread to monitor progress"""
-        while not self.stop_monitoring:
-            try:
-                if os.path.exists(log_file):
-                    with open(log_file, 'r') as f:
-                        content = f.read()
-                        completed = content.count('Copying blob')
-                        if self.total_images > 0:
+        """Background thread to monitor progress
+        
+        The log is tailed incrementally: each tick reads only the bytes appended
+        since the previous one, and only complete lines are scanned so a marker
+        split across two reads is never missed or double counted. When
+        inotify_simple is available the thread sleeps until the log changes,
+        or until it is created in its directory (at most 30s); otherwise it
+        polls every 30s.
+        """
+        log_handle = None
+        completed = 0
+        pending = b''
+        inotify = INotify() if INotify is not None else None
+        watch = None
+        dir_watch = None
+        # Progress is logged at most every 30s and only when it moved, as with the
+        # old 30s poll, even though inotify wakes up to once a second
+        logged = (None, 0.0)
+        
+        try:
+            while not self.stop_monitoring:
+                try:
+                    if log_handle is not None:
+                        # Start over if the log was truncated or replaced
+                        try:
+                            replaced = os.stat(log_file).st_ino != os.fstat(log_handle.fileno()).st_ino
+                        except FileNotFoundError:
+                            replaced = True
+                        if replaced or os.fstat(log_handle.fileno()).st_size < log_handle.tell():
+                            log_handle.close()
+                            log_handle = None
+                    
+                    if log_handle is None and os.path.exists(log_file):
+                        log_handle = open(log_file, 'rb')
+                        completed = 0
+                        pending = b''
+                        if inotify is not None:
+                            watch = inotify.add_watch(
+                                log_file,
+                                inotify_flags.MODIFY | inotify_flags.DELETE_SELF | inotify_flags.MOVE_SELF
+                            )
+                    elif log_handle is None and inotify is not None and dir_watch is None:
+                        # oc image mirror has not created the log yet; wake when it does
+                        dir_watch = inotify.add_watch(
+                            os.path.dirname(log_file) or '.',
+                            inotify_flags.CREATE | inotify_flags.MOVED_TO
+                        )
+                    
+                    if log_handle is not None:
+                        data = pending + log_handle.read()
+                        last_newline = data.rfind(b'\n') + 1
+                        completed += len(_BLOB_RE.findall(data, 0, last_newline))
+                        pending = data[last_newline:]
+                        
+                        now = time.monotonic()
+                        if self.total_images > 0 and completed != logged[0] and now - logged[1] >= 30:
                             percent = (completed * 100) // self.total_images
                             self.log_debug(f"Progress: {completed}/{self.total_images} images ({percent}%)")
-            except Exception as e:
-                self.log_debug(f"Progress monitor error: {e}")
-            
-            time.sleep(30)
+                            logged = (completed, now)
+                except Exception as e:
+                    self.log_debug(f"Progress monitor error: {e}")
+                
+                if watch is not None or dir_watch is not None:
+                    # Wake on the next write, coalescing bursts into one read per second
+                    inotify.read(timeout=30000, read_delay=1000)
+                else:
+                    time.sleep(30)
+        finally:
+            if log_handle is not None:
+                log_handle.close()
+            if inotify is not None:
+                inotify.close()
     
     def stop_progress_monitor(self):
         """Stop the progress monitoring thread"""
@@ -446,10 +935,12 @@ class CP4IDownloader:
         version: str,
         name: str,
         local_dir: str,
-        mapping_file: str
+        mapping_file: str,
+        end_time: Optional[datetime] = None
     ) -> str:
         """Generate comprehensive summary report"""
-        end_time = datetime.now()
+        if end_time is None:
+            end_time = datetime.now()
         duration = end_time - self.start_time
         hours = duration.seconds // 3600
         minutes = (duration.seconds % 3600) // 60
@@ -457,7 +948,7 @@ class CP4IDownloader:
         
         report_file = os.path.join(local_dir, f"{name}-summary-report.txt")
         
-        report_content = f"""========================================
+        header = f"""========================================
 CP4I Download Summary Report
 ========================================
 Status: {status}
@@ -466,6 +957,7 @@ Version: {version}
 Start Time: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}
 End Time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}
 Duration: {hours}h {minutes}m {seconds}s
+Entitlement Key ID: {self._ek_fp or '-'}
 Total Images: {self.total_images}
 Successful: {self.success_count}
 Failed: {len(self.failed_images)}
@@ -477,37 +969,80 @@ Log File: {os.path.join(local_dir, f'{name}-download.log')}
 
 """
         
-        if self.failed_images:
-            report_content += "Failed Images:\n"
-            for img in self.failed_images:
-                report_content += f"  {img}\n"
-            report_content += "\n"
-        
-        report_content += f"""========================================
+        footer = f"""========================================
 Generated by CP4I Downloader v{SCRIPT_VERSION}
 ========================================
 """
         
+        # Assemble the report once, then hand it to the file and stdout in one write each
+        buf = io.StringIO()
+        buf.write(header)
+        if self.failed_images:
+            buf.write("Failed Images:\n")
+            buf.writelines(f"  {img}\n" for img in self.failed_images)
+            buf.write("\n")
+        buf.write(footer)
+        report = buf.getvalue()
+        
         try:
             with open(report_file, 'w') as f:
-                f.write(report_content)
-            logger.info(f"Summary report generated: {report_file}")
-            print(report_content)
+                f.write(report)
+            self.logger.info("Summary report generated: %s", report_file)
+            sys.stdout.write(report + "\n")
             return report_file
         except Exception as e:
-            logger.error(f"Failed to generate summary report: {e}")
+            self.logger.error(f"Failed to generate summary report: {e}")
             return ""
     
     def fetch_operator(self, component: str, version: str, skip_dependencies: bool = True) -> bool:
-        """Fetch operator CASE bundle with retry logic"""
-        logger.info(f"Fetching operator: {component} v{version}")
+        """Fetch operator CASE bundle with retry logic
+        
+        A bundle fetched by an earlier run is reused without calling oc ibm-pak
+        when its index entry in fetch_cache_file is younger than fetch_cache_ttl
+        and the CASE directory has not been modified since.
+        """
+        self.logger.info(f"Fetching operator: {component} v{version}")
+        
+        case_path = os.path.join(
+            self.ibmpak_home,
+            '.ibm-pak', 'data', 'cases',
+            component, version
+        )
+        cache_key = f"{component}@{version}"
+        
+        fetch_index = self._read_fetch_index()
+        entry = fetch_index.get(cache_key)
+        if entry and os.path.isdir(case_path):
+            try:
+                fresh = time.time() - entry['fetched_at'] < self.fetch_cache_ttl
+                unchanged = os.stat(case_path).st_mtime_ns == entry['mtime_ns']
+            except (OSError, KeyError, TypeError):
+                fresh = unchanged = False
+            if fresh and unchanged:
+                self.logger.info(f"✓ Using cached operator from {case_path}")
+                return True
         
         cmd = ['oc', 'ibm-pak', 'get', component, '--version', version]
         if skip_dependencies:
             cmd.append('--skip-dependencies')
         
         if self.retry_with_backoff(cmd):
-            logger.info("✓ Operator fetched successfully")
+            self.logger.info("✓ Operator fetched successfully")
+            
+            # Record the fetch so later runs can skip it; re-read under the lock so
+            # entries written by parallel components in the meantime are kept
+            try:
+                entry = {
+                    'path': case_path,
+                    'mtime_ns': os.stat(case_path).st_mtime_ns,
+                    'fetched_at': time.time()
+                }
+                with _cache_file_lock:
+                    fetch_index = self._read_fetch_index()
+                    fetch_index[cache_key] = entry
+                    _atomic_write_json(self.fetch_cache_file, fetch_index)
+            except OSError as e:
+                self.log_debug(f"Failed to update fetch cache: {e}")
             return True
         else:
             # Check if operator exists locally
@@ -517,19 +1052,30 @@ Generated by CP4I Downloader v{SCRIPT_VERSION}
                 component, version
             )
             if os.path.exists(local_path):
-                logger.warning("Operator fetch failed but found locally. Continuing...")
+                self.logger.warning("Operator fetch failed but found locally. Continuing...")
                 return True
             else:
-                logger.error("Operator fetch failed and not available locally")
+                self.logger.error("Operator fetch failed and not available locally")
                 return False
     
+    def _read_fetch_index(self) -> Dict:
+        """Read the fetched-operator index, or an empty one if missing or corrupt"""
+        try:
+            with open(self.fetch_cache_file, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
     def generate_manifests(
         self,
         component: str,
         version: str,
         final_registry: str,
         filter_pattern: Optional[str] = None,
-        direct_to_registry: bool = False
+        direct_to_registry: bool = False,
+        *,
+        expected_mapping_file: Optional[str] = None
     ) -> Tuple[bool, Optional[str]]:
         """Generate mirror manifests with retry logic
         
@@ -540,18 +1086,20 @@ Generated by CP4I Downloader v{SCRIPT_VERSION}
             filter_pattern: Optional filter pattern
             direct_to_registry: If True, generate manifests for direct registry-to-registry mirroring
                                If False, generate manifests for filesystem mirroring
+            expected_mapping_file: Mapping file path already resolved by the caller;
+                                   returned as is when generation produced it
         """
-        logger.info("Generating mirror manifests...")
+        self.logger.info("Generating mirror manifests...")
         
         # For direct-to-registry: use TARGET_REGISTRY with --install-method OLM
         # For filesystem: use file://integration with --final-registry
         if direct_to_registry:
             target = final_registry
-            logger.info(f"Generating manifests for direct-to-registry mirroring to {final_registry}")
-            logger.info("Using --install-method OLM for direct registry-to-registry transfer")
+            self.logger.info(f"Generating manifests for direct-to-registry mirroring to {final_registry}")
+            self.logger.info("Using --install-method OLM for direct registry-to-registry transfer")
         else:
             target = 'file://integration'
-            logger.info(f"Generating manifests for filesystem mirroring")
+            self.logger.info(f"Generating manifests for filesystem mirroring")
         
         cmd = [
             'oc', 'ibm-pak', 'generate', 'mirror-manifests',
@@ -575,7 +1123,10 @@ Generated by CP4I Downloader v{SCRIPT_VERSION}
             cmd.extend(['--filter', filter_pattern])
         
         if self.retry_with_backoff(cmd):
-            logger.info("✓ Manifests generated successfully")
+            self.logger.info("✓ Manifests generated successfully")
+            
+            if expected_mapping_file and os.path.exists(expected_mapping_file):
+                return (True, expected_mapping_file)
             
             # Get mapping file path
             # For direct-to-registry, the mapping file is images-mapping.txt
@@ -594,18 +1145,54 @@ Generated by CP4I Downloader v{SCRIPT_VERSION}
             
             return (True, mapping_file)
         else:
-            logger.error("Manifest generation failed")
+            self.logger.error("Manifest generation failed")
             return (False, None)
     
+    def _manifest_cache_path(
+        self,
+        component: str,
+        version: str,
+        final_registry: str,
+        filter_pattern: Optional[str],
+        direct_to_registry: bool
+    ) -> str:
+        """Cache record path for one set of manifest generation parameters"""
+        key = hashlib.sha1(
+            f"{component}|{version}|{final_registry}|{filter_pattern}|{direct_to_registry}".encode()
+        ).hexdigest()
+        return os.path.join(self.manifest_cache_dir, f"{key}.json")
+    
+    def _cached_mapping_file(self, cache_path: str) -> Optional[str]:
+        """Mapping file from a previous generation, if it is unchanged on disk"""
+        try:
+            with open(cache_path, 'r') as f:
+                entry = json.load(f)
+            st = os.stat(entry['mapping_file'])
+            if st.st_mtime_ns == entry['mtime_ns'] and st.st_size == entry['size']:
+                return entry['mapping_file']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def _record_mapping_file(self, cache_path: str, mapping_file: str):
+        """Remember a generated mapping file so identical later runs can reuse it"""
+        try:
+            st = os.stat(mapping_file)
+            Path(self.manifest_cache_dir).mkdir(parents=True, exist_ok=True)
+            with _cache_file_lock:
+                _atomic_write_json(cache_path, {'mapping_file': mapping_file, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size})
+        except OSError as e:
+            self.log_debug(f"Failed to update manifest cache: {e}")
+    
     def mirror_images(
         self,
         mapping_file: str,
         target_dir: str,
         registry_auth_file: str,
         max_per_registry: int = None,
-        dry_run: bool = False,
         log_file: str = None,
-        direct_to_registry: bool = False
+        direct_to_registry: bool = False,
+        max_registry: int = None
     ) -> bool:
         """Mirror images using oc image mirror
         
@@ -614,24 +1201,25 @@ Generated by CP4I Downloader v{SCRIPT_VERSION}
             target_dir: Target directory for filesystem mirroring (ignored if direct_to_registry=True)
             registry_auth_file: Path to registry authentication file
             max_per_registry: Maximum parallel downloads per registry
-            dry_run: If True, simulate the mirroring process
-            log_file: Path to log file
+            log_file: Path to log file (mirror output goes to the matching -mirror.log,
+                      or to mirror.log in target_dir when not given)
             direct_to_registry: If True, mirror directly from source to target registry (no local storage)
                                If False, mirror to filesystem using --dir flag
+            max_registry: Maximum registries mirrored from concurrently
+                          (oc image mirror default when not set)
         """
         if max_per_registry is None:
             max_per_registry = self.max_parallel_downloads
+        if max_registry is None:
+            max_registry = self.max_registry
         
-        if dry_run:
-            logger.info("[Dry Run Mode] Simulating image mirror process...")
+        if direct_to_registry:
+            self.logger.info(f"Starting direct registry-to-registry mirror process...")
+            self.logger.info(f"Images will be mirrored directly from source to target registry")
+            self.logger.info(f"No local disk space required (except temporary)")
         else:
-            if direct_to_registry:
-                logger.info(f"Starting direct registry-to-registry mirror process...")
-                logger.info(f"Images will be mirrored directly from source to target registry")
-                logger.info(f"No local disk space required (except temporary)")
-            else:
-                logger.info(f"Starting filesystem mirror process...")
-                logger.info(f"Images will be downloaded to: {target_dir}")
+            self.logger.info(f"Starting filesystem mirror process...")
+            self.logger.info(f"Images will be downloaded to: {target_dir}")
         
         self.download_start_time = datetime.now()
         
@@ -645,79 +1233,83 @@ Generated by CP4I Downloader v{SCRIPT_VERSION}
             '--skip-multiple-scopes',
             f'--max-per-registry={max_per_registry}'
         ]
+        if max_registry:
+            cmd.append(f'--max-registry={max_registry}')
         
         # Add --dir flag ONLY for filesystem mirroring
         # For direct-to-registry, do NOT add --dir flag
         if not direct_to_registry:
             cmd.extend(['--dir', target_dir])
         
-        if dry_run:
-            cmd.append('--dry-run')
-            logger.info(f"[Dry Run] Executing: {' '.join(cmd)}")
+        # Mirror output goes next to the download log, or into target_dir without one
+        if log_file:
+            mirror_log_file = log_file.replace('-download.log', '-mirror.log')
         else:
-            # Determine mirror log file path
-            mirror_log_file = log_file.replace('-download.log', '-mirror.log') if log_file else None
-            if mirror_log_file:
-                logger.info(f"Monitor mirror progress: tail -f {mirror_log_file}")
+            mirror_log_file = os.path.join(target_dir, 'mirror.log')
         
         try:
             # Log the full command for debugging
-            logger.info(f"Executing: {' '.join(cmd)}")
+            self.logger.info(f"Executing: {' '.join(cmd)}")
+            self.logger.info(f"Mirror output will be written to: {mirror_log_file}")
+            self.logger.info(f"Monitor mirror progress: tail -f {mirror_log_file}")
             
-            # Determine mirror log file path
-            mirror_log_file = log_file.replace('-download.log', '-mirror.log') if log_file else None
-            
-            if mirror_log_file:
-                logger.info(f"Mirror output will be written to: {mirror_log_file}")
-                
-                # Open mirror log file for writing
-                with open(mirror_log_file, 'w') as mirror_log:
-                    # Run the command and redirect output to mirror log file
-                    process = subprocess.Popen(
-                        cmd,
-                        stdout=mirror_log,
-                        stderr=subprocess.STDOUT,
-                        text=True
-                    )
-                    
-                    # Log the PID for monitoring
-                    logger.info(f"Image mirroring started in background (PID: {process.pid})")
-                    
-                    # Wait for process to complete
-                    return_code = process.wait()
-            else:
-                # Fallback: run without separate log file
+            # Hand the raw file descriptor to the child so output never passes through Python
+            with open(mirror_log_file, 'wb') as mirror_log:
                 process = subprocess.Popen(
                     cmd,
-                    stdout=subprocess.PIPE,
+                    stdout=mirror_log,
                     stderr=subprocess.STDOUT,
-                    text=True
+                    env=self._child_env
                 )
+                self._mirror_process = process
+                if self._cancelled.is_set():
+                    # stop() ran between the last step check and Popen
+                    process.terminate()
                 
-                # Stream output to main logger
-                for line in iter(process.stdout.readline, ''):
-                    if line:
-                        logger.info(line.rstrip())
+                # Log the PID for monitoring
+                self.logger.info(f"Image mirroring started in background (PID: {process.pid})")
                 
-                process.stdout.close()
-                return_code = process.wait()
+                # Make the buffered download log current before blocking on the mirror
+                for handler in self.logger.handlers:
+                    handler.flush()
+                
+                # Wait for process to complete
+                try:
+                    return_code = process.wait()
+                finally:
+                    self._mirror_process = None
             
             if return_code == 0:
-                if dry_run:
-                    logger.info("✓ [Dry Run] Image mirror simulation completed successfully")
-                else:
-                    logger.info("✓ info: Mirroring completed")
+                self.logger.info("✓ info: Mirroring completed")
                 return True
             else:
-                logger.error(f"Image mirroring failed with code {return_code}")
+                self.logger.error(f"Image mirroring failed with code {return_code}")
                 return False
         
         except Exception as e:
-            logger.error(f"Mirror error: {e}")
+            self.logger.error(f"Mirror error: {e}")
             import traceback
-            logger.error(traceback.format_exc())
+            self.logger.error(traceback.format_exc())
             return False
     
+    @contextlib.contextmanager
+    def _scoped_file_log(self, log_file: str):
+        """Attach a file handler for log_file to self.logger for the duration of the block
+        
+        Records are buffered and written in batches; errors flush immediately
+        and the file is only created on the first flush.
+        """
+        log_target = logging.FileHandler(log_file, delay=True, encoding='utf-8', errors='replace')
+        log_target.setFormatter(logging.Formatter('[%(asctime)s] [%(levelname)s] %(message)s'))
+        file_handler = MemoryHandler(512, flushLevel=logging.ERROR, target=log_target, flushOnClose=True)
+        self.logger.addHandler(file_handler)
+        try:
+            yield file_handler
+        finally:
+            self.logger.removeHandler(file_handler)
+            file_handler.close()
+            log_target.close()
+    
     def download_component(
         self,
         component: str,
@@ -731,7 +1323,8 @@ Generated by CP4I Downloader v{SCRIPT_VERSION}
         retry: bool = False,
         force_retry: bool = False,
         max_per_registry: int = None,
-        direct_to_registry: bool = False
+        direct_to_registry: bool = False,
+        max_registry: int = None
     ) -> Dict:
         """
         Main method to download a CP4I component
@@ -750,6 +1343,7 @@ Generated by CP4I Downloader v{SCRIPT_VERSION}
             max_per_registry: Maximum parallel downloads
             direct_to_registry: If True, mirror directly to target registry without local storage
                                If False, download to filesystem first
+            max_registry: Maximum registries mirrored from concurrently
         
         Returns:
             Dict with status, message, and details
@@ -759,179 +1353,276 @@ Generated by CP4I Downloader v{SCRIPT_VERSION}
             'component': component,
             'version': version,
             'name': name,
-            'start_time': self.start_time.isoformat(),
+            'start_time': self._start_iso,
             'messages': []
         }
         
         # Set default registry auth file
         if not registry_auth_file:
             registry_auth_file = os.path.expanduser('~/.docker/config.json')
-            if not os.path.exists(registry_auth_file):
+            if not _path_exists(registry_auth_file):
                 registry_auth_file = '/root/.docker/config.json'
         
+        # Fingerprint the entitlement key once; never the key itself in logs or payloads
+        if entitlement_key:
+            self._ek_fp = hashlib.blake2s(entitlement_key.encode(), digest_size=8).hexdigest()
+            result['ek_fp'] = self._ek_fp
+        
         # Create working directory
         local_dir = os.path.join(self.home_dir, name)
-        Path(local_dir).mkdir(parents=True, exist_ok=True)
+        if local_dir not in self._created_dirs:
+            Path(local_dir).mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(local_dir)
         result['work_dir'] = local_dir
         
-        # Setup logging to file
+        # Setup logging to file on a per-download child logger, so concurrent
+        # downloads in the same process each get only their own records
+        self.logger = logger.getChild(name.replace('.', '_'))
         log_file = os.path.join(local_dir, f'{name}-download.log')
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(logging.Formatter('[%(asctime)s] [%(levelname)s] %(message)s'))
-        logger.addHandler(file_handler)
         
-        # Set environment variables
-        os.environ['IBMPAK_HOME'] = self.ibmpak_home
-        os.environ['REGISTRY_AUTH_FILE'] = registry_auth_file
+        # Environment for oc / podman; kept per downloader instead of in
+        # os.environ so concurrent downloads cannot see each other's settings
+        self._child_env['REGISTRY_AUTH_FILE'] = registry_auth_file
         
-        try:
-            logger.info("=" * 60)
-            logger.info(f"CP4I Component Downloader v{SCRIPT_VERSION}")
-            logger.info("=" * 60)
-            logger.info(f"Working directory: {local_dir}")
-            
-            # Define mapping file path based on mirror mode
-            # For direct-to-registry: use images-mapping.txt
-            # For filesystem: use images-mapping-to-filesystem.txt
-            if direct_to_registry:
-                mapping_filename = 'images-mapping.txt'
-            else:
-                mapping_filename = 'images-mapping-to-filesystem.txt'
-            
-            mapping_file = os.path.join(
-                self.ibmpak_home,
-                '.ibm-pak', 'data', 'mirror',
-                component, version,
-                mapping_filename
-            )
-            
-            # ========= RETRY MODES =========
-            if force_retry or retry:
-                if os.path.exists(mapping_file):
-                    logger.info(f"Resuming mirror from: {mapping_file}")
-                    
-                    if dry_run:
-                        logger.info("[Dry Run] Would resume image mirror")
-                        result['success'] = True
-                        result['messages'].append("[Dry Run] Resume simulation")
-                    else:
-                        self.track_progress(mapping_file, log_file)
-                        logger.info(f"Mirror re-initiated for {component} v{version}")
-                        self.send_notification("RESUMED", f"Download resumed for {component} v{version}", component, version)
+        with self._scoped_file_log(log_file):
+            try:
+                self.logger.info("%s\nWorking directory: %s", _HEADER, local_dir)
+                
+                # Define mapping file path based on mirror mode
+                # For direct-to-registry: use images-mapping.txt
+                # For filesystem: use images-mapping-to-filesystem.txt
+                mapping_filename = 'images-mapping.txt' if direct_to_registry else 'images-mapping-to-filesystem.txt'
+                mapping_file = f"{self.ibmpak_home}/.ibm-pak/data/mirror/{component}/{version}/{mapping_filename}"
+                
+                manifest_cache_path = self._manifest_cache_path(
+                    component, version, final_registry, filter_pattern, direct_to_registry
+                )
+                
+                auth_cache_key = self._auth_cache_key(entitlement_key)
+                
+                # ========= RETRY MODES =========
+                if force_retry:
+                    # Manifests must be regenerated on the next normal run
+                    try:
+                        os.remove(manifest_cache_path)
+                    except OSError:
+                        pass
+                
+                if force_retry or retry:
+                    if os.path.exists(mapping_file):
+                        self.logger.info(f"Resuming mirror from: {mapping_file}")
                         
-                        if self.mirror_images(mapping_file, local_dir, registry_auth_file, max_per_registry, dry_run, log_file, direct_to_registry):
+                        if dry_run:
+                            self.logger.info("[Dry Run] Would resume image mirror")
                             result['success'] = True
-                            result['messages'].append("Mirror resumed and completed successfully")
-                            self.send_notification("COMPLETED", f"Download completed for {component} v{version}", component, version)
+                            result['messages'].append("[Dry Run] Resume simulation")
                         else:
-                            result['messages'].append("Mirror resume failed")
-                            self.send_notification("FAILED", f"Download failed for {component} v{version}", component, version)
-                    
-                    self.stop_progress_monitor()
-                    result['end_time'] = datetime.now().isoformat()
-                    self.generate_summary_report(
-                        "COMPLETED" if result['success'] else "FAILED",
-                        component, version, name, local_dir, mapping_file
+                            # Re-authenticate unless a recent login is still on record;
+                            # --force-retry with an entitlement key always runs podman login
+                            if self._cancelled_step(result):
+                                return result
+                            with _registry_login_lock:
+                                if not force_retry and self._auth_cached(self._read_auth_cache(), auth_cache_key, registry_auth_file):
+                                    self.logger.info("✓ Registry authentication cached")
+                                elif self.authenticate_registry(entitlement_key, registry_auth_file, force=force_retry):
+                                    self._update_auth_cache(auth_cache_key, registry_auth_file)
+                                else:
+                                    self.logger.warning("Re-authentication failed, resuming with existing credentials")
+                            
+                            if self._cancelled_step(result):
+                                return result
+                            self.track_progress(mapping_file, log_file)
+                            self.logger.info(f"Mirror re-initiated for {component} v{version}")
+                            self.send_notification("RESUMED", f"Download resumed for {component} v{version}", component, version)
+                            
+                            if self.mirror_images(mapping_file, local_dir, registry_auth_file, max_per_registry, log_file=log_file, direct_to_registry=direct_to_registry, max_registry=max_registry):
+                                result['success'] = True
+                                result['messages'].append("Mirror resumed and completed successfully")
+                                self.send_notification("COMPLETED", f"Download completed for {component} v{version}", component, version)
+                            else:
+                                result['messages'].append("Mirror resume failed")
+                                self.send_notification("FAILED", f"Download failed for {component} v{version}", component, version)
+                        
+                        self.stop_progress_monitor()
+                        end_time = datetime.now()
+                        result['end_time'] = end_time.isoformat()
+                        self.generate_summary_report(
+                            "COMPLETED" if result['success'] else "FAILED",
+                            component, version, name, local_dir, mapping_file, end_time
+                        )
+                        return result
+                    else:
+                        result['messages'].append(f"Mapping file not found for retry: {mapping_file}")
+                        self.logger.error(result['messages'][-1])
+                        return result
+                
+                # ========= DRY RUN =========
+                # Describe the plan without running any checks, logins or oc commands.
+                # The plan still goes to the download log, where the web UI detects dry runs.
+                if dry_run:
+                    self.logger.info(
+                        "[Dry Run] Plan for %s v%s:\n"
+                        "  1. Check prerequisites%s\n"
+                        "  2. Authenticate to cp.icr.io using %s\n"
+                        "  3. Configure ibm-pak repository and fetch the CASE bundle\n"
+                        "  4. Generate %s mirror manifests for %s%s\n"
+                        "  5. Mirror images listed in %s (max %s per registry)",
+                        component, version,
+                        "" if direct_to_registry else f" and {self.min_disk_space_gb}GB free in {local_dir}",
+                        registry_auth_file,
+                        "direct-to-registry" if direct_to_registry else "filesystem",
+                        final_registry,
+                        f" (filter: {filter_pattern})" if filter_pattern else "",
+                        mapping_file,
+                        max_per_registry or self.max_parallel_downloads
                     )
+                    result['success'] = True
+                    result['messages'].append("[Dry Run] plan printed")
                     return result
+                
+                # ========= NORMAL DOWNLOAD FLOW =========
+                
+                # Step 1: Check prerequisites
+                if self._cancelled_step(result):
+                    return result
+                prereqs_ok, missing = self.check_prerequisites()
+                if not prereqs_ok:
+                    result['messages'].append(f"Missing prerequisites: {', '.join(missing)}")
+                    return result
+                result['messages'].append("Prerequisites check passed")
+                
+                # Step 2: Check disk space (skip for direct-to-registry mode)
+                if not direct_to_registry:
+                    space_ok, available_gb = self.check_disk_space(local_dir)
+                    if not space_ok:
+                        result['messages'].append(f"Insufficient disk space: {available_gb}GB available")
+                        return result
+                    result['messages'].append(f"Disk space check passed: {available_gb}GB available")
                 else:
-                    result['messages'].append(f"Mapping file not found for retry: {mapping_file}")
-                    logger.error(result['messages'][-1])
+                    self.logger.info("Skipping disk space check for direct-to-registry mode")
+                    result['messages'].append("Direct-to-registry mode: No local disk space required")
+                
+                # Step 3: Authenticate, only once both checks have passed so a failed
+                # check never leaves a login running. A recent login against an
+                # unchanged auth file is reused as is; under the lock, parallel
+                # components find the login the first one recorded.
+                if self._cancelled_step(result):
                     return result
-            
-            # ========= NORMAL DOWNLOAD FLOW =========
-            
-            # Step 1: Check prerequisites
-            prereqs_ok, missing = self.check_prerequisites()
-            if not prereqs_ok:
-                result['messages'].append(f"Missing prerequisites: {', '.join(missing)}")
-                return result
-            result['messages'].append("Prerequisites check passed")
-            
-            # Step 2: Check disk space (skip for direct-to-registry mode)
-            if not direct_to_registry:
-                space_ok, available_gb = self.check_disk_space(local_dir)
-                if not space_ok:
-                    result['messages'].append(f"Insufficient disk space: {available_gb}GB available")
+                with _registry_login_lock:
+                    auth_cached = self._auth_cached(self._read_auth_cache(), auth_cache_key, registry_auth_file)
+                    authenticated = auth_cached or self.authenticate_registry(entitlement_key, registry_auth_file)
+                    if authenticated and not auth_cached:
+                        self._update_auth_cache(auth_cache_key, registry_auth_file)
+                if auth_cached:
+                    self.logger.info("✓ Registry authentication cached")
+                    result['messages'].append("Registry authentication cached")
+                elif not authenticated:
+                    result['messages'].append("Registry authentication failed")
+                    return result
+                else:
+                    result['messages'].append("Registry authentication successful")
+                
+                # Step 4: Configure repository
+                if self._cancelled_step(result):
+                    return result
+                with _ibmpak_lock:
+                    if self.ibmpak_home not in _configured_ibmpak_homes and self.configure_ibmpak_repo():
+                        _configured_ibmpak_homes.add(self.ibmpak_home)
+                result['messages'].append("Repository configured")
+                
+                # Step 5: Fetch operator
+                if self._cancelled_step(result):
+                    return result
+                with _ibmpak_lock:
+                    operator_fetched = self.fetch_operator(component, version)
+                if not operator_fetched:
+                    result['messages'].append("Operator fetch failed")
+                    return result
+                result['messages'].append("Operator fetched successfully")
+                
+                # Step 6: Generate manifests, unless an identical earlier run left them on disk
+                if self._cancelled_step(result):
+                    return result
+                cached_mapping_file = self._cached_mapping_file(manifest_cache_path)
+                if cached_mapping_file:
+                    mapping_file = cached_mapping_file
+                    self.logger.info(f"✓ Using cached manifests: {mapping_file}")
+                    result['messages'].append("Manifests from cache")
+                else:
+                    success, mapping_file = self.generate_manifests(
+                        component, version, final_registry, filter_pattern, direct_to_registry,
+                        expected_mapping_file=mapping_file
+                    )
+                    if not success or not mapping_file:
+                        result['messages'].append("Manifest generation failed")
+                        return result
+                    self._record_mapping_file(manifest_cache_path, mapping_file)
+                    result['messages'].append("Manifests generated successfully")
+                result['mapping_file'] = mapping_file
+                
+                # Step 7: Mirror images
+                if self._cancelled_step(result):
                     return result
-                result['messages'].append(f"Disk space check passed: {available_gb}GB available")
-            else:
-                logger.info("Skipping disk space check for direct-to-registry mode")
-                result['messages'].append("Direct-to-registry mode: No local disk space required")
-            
-            # Step 3: Authenticate
-            if not self.authenticate_registry(entitlement_key, registry_auth_file):
-                result['messages'].append("Registry authentication failed")
-                return result
-            result['messages'].append("Registry authentication successful")
-            
-            # Step 4: Configure repository
-            self.configure_ibmpak_repo()
-            result['messages'].append("Repository configured")
-            
-            # Step 5: Fetch operator
-            if not self.fetch_operator(component, version):
-                result['messages'].append("Operator fetch failed")
-                return result
-            result['messages'].append("Operator fetched successfully")
-            
-            # Step 6: Generate manifests
-            success, mapping_file = self.generate_manifests(
-                component, version, final_registry, filter_pattern, direct_to_registry
-            )
-            if not success or not mapping_file:
-                result['messages'].append("Manifest generation failed")
-                return result
-            result['messages'].append("Manifests generated successfully")
-            result['mapping_file'] = mapping_file
-            
-            # Step 7: Mirror images
-            if not dry_run:
                 self.track_progress(mapping_file, log_file)
                 self.send_notification("STARTED", f"Download started for {component} v{version}", component, version)
-            
-            if self.mirror_images(mapping_file, local_dir, registry_auth_file, max_per_registry, dry_run, log_file, direct_to_registry):
-                if dry_run:
-                    result['messages'].append("[Dry Run] Image mirror simulation completed")
-                else:
+                
+                if self.mirror_images(mapping_file, local_dir, registry_auth_file, max_per_registry, log_file=log_file, direct_to_registry=direct_to_registry, max_registry=max_registry):
                     result['messages'].append("Image mirroring completed successfully")
                     self.send_notification("COMPLETED", f"Download completed for {component} v{version}", component, version)
-                result['success'] = True
-            else:
-                result['messages'].append("Image mirroring failed")
-                self.send_notification("FAILED", f"Download failed for {component} v{version}", component, version)
-            
-            # Stop progress monitoring
-            self.stop_progress_monitor()
-            
-            # Generate summary report
-            result['end_time'] = datetime.now().isoformat()
-            result['duration'] = str(datetime.now() - self.start_time)
-            
-            report_file = self.generate_summary_report(
-                "COMPLETED" if result['success'] else "FAILED",
-                component, version, name, local_dir, mapping_file
-            )
-            result['report_file'] = report_file
-            
-            # Log retry command
-            if result['success']:
-                logger.info(f"✓ Setup complete. Download running.")
-            logger.info(f"To retry if needed: {sys.argv[0]} --component {component} --version {version} --name {name} --retry")
-            
-        except Exception as e:
-            logger.error(f"Download failed: {e}")
-            result['messages'].append(f"Error: {str(e)}")
-            self.stop_progress_monitor()
-            self.send_notification("FAILED", f"Download error: {str(e)}", component, version)
-        
-        finally:
-            logger.removeHandler(file_handler)
-            file_handler.close()
+                    result['success'] = True
+                else:
+                    result['messages'].append("Image mirroring failed")
+                    self.send_notification("FAILED", f"Download failed for {component} v{version}", component, version)
+                
+                # Stop progress monitoring
+                self.stop_progress_monitor()
+                
+                # Generate summary report
+                end_time = datetime.now()
+                result['end_time'] = end_time.isoformat()
+                result['duration'] = str(end_time - self.start_time)
+                
+                report_file = self.generate_summary_report(
+                    "COMPLETED" if result['success'] else "FAILED",
+                    component, version, name, local_dir, mapping_file, end_time
+                )
+                result['report_file'] = report_file
+                
+                # Log retry command
+                if result['success']:
+                    self.logger.info(f"✓ Setup complete. Download running.")
+                self.logger.info(f"To retry if needed: {sys.argv[0]} --component {component} --version {version} --name {name} --retry")
+                
+            except Exception as e:
+                self.logger.error(f"Download failed: {e}")
+                result['messages'].append(f"Error: {str(e)}")
+                self.stop_progress_monitor()
+                self.send_notification("FAILED", f"Download error: {str(e)}", component, version)
         
         return result
 
 
+def _filter_pattern(value: str) -> str:
+    """argparse type for --filter: reject patterns that do not compile"""
+    try:
+        _filter_re_engine.compile(value)
+    except Exception as e:
+        raise argparse.ArgumentTypeError(f"invalid filter pattern {value!r}: {e}")
+    return value
+
+
+def _registry(value: str) -> str:
+    """argparse type for --final-registry: require host[:port][/namespace]"""
+    host, _, port = value.split('/', 1)[0].partition(':')
+    try:
+        port_ok = 0 < int(port or '443') < 65536
+    except ValueError:
+        port_ok = False
+    if not host or not port_ok:
+        raise argparse.ArgumentTypeError(f"invalid registry {value!r}, expected host[:port]")
+    return value
+
+
 # CLI interface
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
@@ -955,6 +1646,10 @@ Examples:
   # Retry failed download
   %(prog)s --component ibm-eventstreams --version 11.4.0 --name es-11.4.0 --retry
 
+  # Several components in parallel (comma-separated, matched by position)
+  %(prog)s --component ibm-mq,ibm-eventstreams --version 9.3.5,11.4.0 --name mq-9.3.5,es-11.4.0 \\
+    --parallel-components 2
+
 Environment Variables:
   CP4I_ENTITLEMENT_KEY      IBM entitlement key
   CP4I_WEBHOOK_URL          Webhook URL for notifications
@@ -962,60 +1657,92 @@ Environment Variables:
         """
     )
     
-    parser.add_argument('--component', help='Component name')
-    parser.add_argument('--version', help='Component version')
-    parser.add_argument('--name', help='Download directory name')
+    parser.add_argument('--component', help='Component name (comma-separated for several)')
+    parser.add_argument('--version', help='Component version (comma-separated, one per component)')
+    parser.add_argument('--name', help='Download directory name (comma-separated, one per component)')
     parser.add_argument('--home-dir', default='/opt/cp4i', help='Home directory (default: /opt/cp4i)')
-    parser.add_argument('--final-registry', default='registry.example.com:5000', help='Final registry')
+    parser.add_argument('--final-registry', type=_registry, default='registry.example.com:5000', help='Final registry')
     parser.add_argument('--registry-auth-file', help='Registry auth file')
     parser.add_argument('--entitlement-key', help='IBM Entitlement Key')
-    parser.add_argument('--filter', help='Manifest filter pattern')
+    parser.add_argument('--filter', type=_filter_pattern, help='Manifest filter pattern')
     parser.add_argument('--dry-run', action='store_true', help='Dry run mode')
     parser.add_argument('--retry', action='store_true', help='Resume previous download')
     parser.add_argument('--force-retry', action='store_true', help='Force retry from mapping file')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
     parser.add_argument('--max-per-registry', type=int, default=2, help='Max parallel downloads (default: 2)')
+    parser.add_argument('--max-registry', type=int, help='Max registries mirrored from concurrently (default: oc default of 4)')
     parser.add_argument('--direct-to-registry', action='store_true', help='Mirror directly to target registry (no local storage)')
     parser.add_argument('--create-config', action='store_true', help='Create sample configuration file')
+    parser.add_argument('--parallel-components', type=int, default=max(1, (os.cpu_count() or 1) - 2),
+                        help='Components to download concurrently (default: CPU count - 2)')
     
     args = parser.parse_args()
     
     # Handle create-config
     if args.create_config:
         downloader = CP4IDownloader(args.home_dir)
-        sys.exit(0 if downloader.create_sample_config() else 1)
+        created = downloader.create_sample_config()
+        downloader.close()
+        sys.exit(0 if created else 1)
     
     # Validate required arguments for download
     if not args.component or not args.version or not args.name:
         parser.error("--component, --version, and --name are required for download operations")
     
+    components = [c.strip() for c in args.component.split(',')]
+    versions = [v.strip() for v in args.version.split(',')]
+    names = [n.strip() for n in args.name.split(',')]
+    if not (len(components) == len(versions) == len(names)):
+        parser.error("--component, --version, and --name must list the same number of values")
+    if len(set(names)) != len(names):
+        parser.error("--name values must be unique; each download needs its own directory and logs")
+    
     # Set verbose logging
     if args.verbose:
         logger.setLevel(logging.DEBUG)
     
-    downloader = CP4IDownloader(args.home_dir, args.verbose)
-    
-    result = downloader.download_component(
-        component=args.component,
-        version=args.version,
-        name=args.name,
-        final_registry=args.final_registry,
-        registry_auth_file=args.registry_auth_file,
-        entitlement_key=args.entitlement_key,
-        filter_pattern=args.filter,
-        dry_run=args.dry_run,
-        retry=args.retry,
-        force_retry=args.force_retry,
-        max_per_registry=args.max_per_registry,
-        direct_to_registry=args.direct_to_registry
-    )
+    # One downloader per component: each tracks its own timing, progress and log file
+    downloaders = [CP4IDownloader(args.home_dir, args.verbose) for _ in components]
+    
+    # One handler for the whole process, so a signal stops every component's download
+    def stop_all(signum, frame):
+        for downloader in downloaders:
+            downloader.stop()
+        sys.exit(1)
+    
+    signal.signal(signal.SIGINT, stop_all)
+    signal.signal(signal.SIGTERM, stop_all)
+    
+    def run_download(downloader, component, version, name):
+        return downloader.download_component(
+            component=component,
+            version=version,
+            name=name,
+            final_registry=args.final_registry,
+            registry_auth_file=args.registry_auth_file,
+            entitlement_key=args.entitlement_key,
+            filter_pattern=args.filter,
+            dry_run=args.dry_run,
+            retry=args.retry,
+            force_retry=args.force_retry,
+            max_per_registry=args.max_per_registry,
+            direct_to_registry=args.direct_to_registry,
+            max_registry=args.max_registry
+        )
+    
+    if len(components) == 1:
+        results = [run_download(downloaders[0], components[0], versions[0], names[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, args.parallel_components)) as executor:
+            results = list(executor.map(run_download, downloaders, components, versions, names))
+    
+    for downloader in downloaders:
+        downloader.close()
     
-    print("\n" + "=" * 60)
-    print("DOWNLOAD RESULT")
-    print("=" * 60)
-    print(json.dumps(result, indent=2))
-    print("=" * 60)
+    sys.stdout.write(f"\n{_BANNER}\nDOWNLOAD RESULT\n{_BANNER}\n")
+    json.dump(results[0] if len(results) == 1 else results, sys.stdout, indent=2)
+    sys.stdout.write(f"\n{_BANNER}\n")
     
-    sys.exit(0 if result['success'] else 1)
+    sys.exit(0 if all(r['success'] for r in results) else 1)
 
 # Made with Bob
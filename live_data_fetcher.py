@@ -4,18 +4,244 @@ Live Data Fetcher for CP4I Downloader
 Fetches real-time version and support matrix data from IBM and Red Hat sources
 """
 
+import hashlib
 import json
 import os
+import re
+import threading
 import time
 import requests
-from datetime import datetime, timedelta
+import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Numeric parts of a version string, for ordering 10.0.0 after 9.9.9
+_VER_RE = re.compile(r'\d+')
+
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Returned by _make_request when a conditional GET is answered with 304
+_NOT_MODIFIED = object()
+
+# Splits a GitHub contents API URL into the repository API URL, owner/repo and path
+_GITHUB_CONTENTS_RE = re.compile(r'^(https://api\.github\.com/repos/([^/]+/[^/]+))/contents/(.+?)/?$')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write(path: str, payload: bytes) -> None:
+    """Write payload to path in one write() and rename it into place, so readers never see a partial file"""
+    # Unique per thread: the fetch fan-out writes cache files concurrently
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=0) as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _utc_now() -> str:
+    """Current UTC time in ISO format, for fetched_at / refreshed_at stamps"""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes (indented unless told otherwise), with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(obj)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+# Common Red Hat operators for OpenShift; static, so built once and never cached to disk
+_REDHAT_OPERATORS = (
+    {
+        "name": "Red Hat OpenShift Serverless",
+        "package": "serverless-operator",
+        "catalog": "redhat-operators",
+        "description": "Provides Knative Serving and Eventing capabilities"
+    },
+    {
+        "name": "Red Hat OpenShift Service Mesh",
+        "package": "servicemeshoperator",
+        "catalog": "redhat-operators",
+        "description": "Service mesh based on Istio"
+    },
+    {
+        "name": "Red Hat OpenShift Pipelines",
+        "package": "openshift-pipelines-operator-rh",
+        "catalog": "redhat-operators",
+        "description": "CI/CD solution based on Tekton"
+    },
+    {
+        "name": "Red Hat OpenShift GitOps",
+        "package": "openshift-gitops-operator",
+        "catalog": "redhat-operators",
+        "description": "GitOps solution based on Argo CD"
+    },
+    {
+        "name": "Red Hat OpenShift Logging",
+        "package": "cluster-logging",
+        "catalog": "redhat-operators",
+        "description": "Cluster logging based on Elasticsearch, Fluentd, and Kibana"
+    },
+    {
+        "name": "Red Hat OpenShift Elasticsearch Operator",
+        "package": "elasticsearch-operator",
+        "catalog": "redhat-operators",
+        "description": "Elasticsearch cluster management"
+    },
+    {
+        "name": "Red Hat OpenShift distributed tracing platform",
+        "package": "jaeger-product",
+        "catalog": "redhat-operators",
+        "description": "Distributed tracing based on Jaeger"
+    },
+    {
+        "name": "Red Hat OpenShift distributed tracing data collection",
+        "package": "opentelemetry-product",
+        "catalog": "redhat-operators",
+        "description": "OpenTelemetry Collector for distributed tracing"
+    },
+    {
+        "name": "Kiali Operator",
+        "package": "kiali-ossm",
+        "catalog": "redhat-operators",
+        "description": "Service mesh observability"
+    },
+    {
+        "name": "Red Hat Integration - AMQ Streams",
+        "package": "amq-streams",
+        "catalog": "redhat-operators",
+        "description": "Apache Kafka on OpenShift"
+    },
+    {
+        "name": "Red Hat Integration - AMQ Broker",
+        "package": "amq-broker-rhel8",
+        "catalog": "redhat-operators",
+        "description": "ActiveMQ Artemis messaging broker"
+    },
+    {
+        "name": "Red Hat Integration - 3scale",
+        "package": "3scale-operator",
+        "catalog": "redhat-operators",
+        "description": "API management platform"
+    },
+    {
+        "name": "Red Hat Integration - Camel K",
+        "package": "red-hat-camel-k",
+        "catalog": "redhat-operators",
+        "description": "Lightweight integration framework"
+    },
+    {
+        "name": "Red Hat OpenShift Data Foundation",
+        "package": "odf-operator",
+        "catalog": "redhat-operators",
+        "description": "Software-defined storage solution"
+    },
+    {
+        "name": "Red Hat Advanced Cluster Security",
+        "package": "rhacs-operator",
+        "catalog": "redhat-operators",
+        "description": "Kubernetes-native security platform"
+    },
+    {
+        "name": "Red Hat Quay",
+        "package": "quay-operator",
+        "catalog": "redhat-operators",
+        "description": "Container image registry"
+    },
+    {
+        "name": "Red Hat OpenShift Dev Spaces",
+        "package": "devspaces",
+        "catalog": "redhat-operators",
+        "description": "Cloud development environment"
+    },
+    {
+        "name": "Web Terminal",
+        "package": "web-terminal",
+        "catalog": "redhat-operators",
+        "description": "Terminal access from OpenShift console"
+    },
+    {
+        "name": "Red Hat Compliance Operator",
+        "package": "compliance-operator",
+        "catalog": "redhat-operators",
+        "description": "Compliance scanning and remediation"
+    },
+    {
+        "name": "File Integrity Operator",
+        "package": "file-integrity-operator",
+        "catalog": "redhat-operators",
+        "description": "File integrity monitoring"
+    },
+    {
+        "name": "Red Hat OpenShift Local Storage",
+        "package": "local-storage-operator",
+        "catalog": "redhat-operators",
+        "description": "Local storage management"
+    },
+    {
+        "name": "Red Hat OpenShift Virtualization",
+        "package": "kubevirt-hyperconverged",
+        "catalog": "redhat-operators",
+        "description": "Virtual machine management on OpenShift"
+    },
+    {
+        "name": "Red Hat Cost Management Metrics Operator",
+        "package": "costmanagement-metrics-operator",
+        "catalog": "redhat-operators",
+        "description": "Cost management and optimization"
+    },
+    {
+        "name": "Node Maintenance Operator",
+        "package": "node-maintenance-operator",
+        "catalog": "redhat-operators",
+        "description": "Node maintenance and cordoning"
+    },
+    {
+        "name": "Poison Pill Operator",
+        "package": "poison-pill-manager",
+        "catalog": "redhat-operators",
+        "description": "Node remediation for unhealthy nodes"
+    }
+)
+
 
 class LiveDataFetcher:
     """Fetches live version and support data from external sources"""
@@ -26,51 +252,123 @@ class LiveDataFetcher:
         self.cache_dir = self.config.get('cache', {}).get('directory', '.cache')
         self.cache_enabled = self.config.get('cache', {}).get('enabled', True)
         self.cache_max_age = self.config.get('cache', {}).get('max_age_hours', 24)
+        self._cache_max_age_seconds = self.cache_max_age * 3600
+        self.cache_format = self.config.get('cache', {}).get('format', 'json')
+        if self.cache_format == 'msgpack' and msgpack is None:
+            logger.warning("Cache format 'msgpack' requested but msgpack is not installed, using json")
+            self.cache_format = 'json'
+        self._retry_attempts = self.config.get('data_sources', {}).get('ibm_registry', {}).get('retry_attempts', 3)
+        
+        # Parsed cache entries by key, with the time they were written
+        self._mem_cache: Dict[str, tuple] = {}
+        
+        # Parsed local fallback files by path; they only change with a redeploy
+        self._local_files: Dict[str, Any] = {}
+        
+        # Serializes the repository-wide Git tree request, see _fetch_case_tree
+        self._case_tree_lock = threading.Lock()
         
         # Create cache directory if it doesn't exist
         if self.cache_enabled and not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
+        
+        # Pooled HTTP session: GitHub and Red Hat are hit many times per refresh,
+        # so connections are kept alive and failed requests retried by urllib3
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=max(0, self._retry_attempts - 1),
+                backoff_factor=0.5,
+                # Spread retries out so parallel fetches don't hit a recovering upstream in lockstep
+                backoff_jitter=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        )
+        self._session = requests.Session()
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
     
     def _load_config(self, config_file: str) -> Dict:
         """Load configuration from JSON file"""
         try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            with open(config_file, 'rb') as f:
+                return _loads(f.read())
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             return {}
     
     def _get_cache_path(self, cache_key: str) -> str:
         """Get cache file path for a given key"""
-        return os.path.join(self.cache_dir, f"{cache_key}.json")
+        return os.path.join(self.cache_dir, f"{cache_key}.{self.cache_format}")
     
     def _is_cache_valid(self, cache_path: str) -> bool:
         """Check if cache file is still valid"""
-        if not os.path.exists(cache_path):
-            return False
-        
-        file_time = datetime.fromtimestamp(os.path.getmtime(cache_path))
-        max_age = timedelta(hours=self.cache_max_age)
-        
-        return datetime.now() - file_time < max_age
+        return self._cache_mtime(cache_path) is not None
+    
+    def _cache_mtime(self, cache_path: str) -> Optional[float]:
+        """mtime of a cache file younger than the max age, from a single stat; None otherwise"""
+        try:
+            mtime = os.stat(cache_path).st_mtime
+        except OSError:
+            return None
+        return mtime if time.time() - mtime < self._cache_max_age_seconds else None
     
     def _read_cache(self, cache_key: str) -> Optional[Dict]:
-        """Read data from cache"""
+        """Read data from cache, from memory when this instance already has it"""
         if not self.cache_enabled:
             return None
         
+        cached = self._mem_cache.get(cache_key)
+        if cached and time.time() - cached[0] < self._cache_max_age_seconds:
+            return cached[1]
+        
         cache_path = self._get_cache_path(cache_key)
+        mtime = self._cache_mtime(cache_path)
         
-        if self._is_cache_valid(cache_path):
+        if mtime is not None:
             try:
-                with open(cache_path, 'r') as f:
-                    logger.info(f"Using cached data for {cache_key}")
-                    return json.load(f)
+                logger.info(f"Using cached data for {cache_key}")
+                data = self._load_cache_file(cache_path)
+                self._mem_cache[cache_key] = (mtime, data)
+                return data
             except Exception as e:
                 logger.warning(f"Failed to read cache: {e}")
         
         return None
     
+    def _load_cache_file(self, cache_path: str) -> Any:
+        """Decode a cache file in the configured format"""
+        with open(cache_path, 'rb') as f:
+            if self.cache_format == 'msgpack':
+                return msgpack.unpackb(f.read(), raw=False)
+            return _loads(f.read())
+    
+    def _read_stale_cache(self, cache_key: str) -> Dict:
+        """Read a cache entry regardless of age, for revalidation; empty if there is none"""
+        if not self.cache_enabled:
+            return {}
+        
+        cached = self._mem_cache.get(cache_key)
+        if cached:
+            return cached[1]
+        
+        try:
+            data = self._load_cache_file(self._get_cache_path(cache_key))
+        except Exception:
+            return {}
+        return data if isinstance(data, dict) else {}
+    
+    def _touch_cache(self, cache_key: str, data: Dict) -> None:
+        """Mark a revalidated cache entry as fresh again without rewriting it"""
+        try:
+            os.utime(self._get_cache_path(cache_key), None)
+        except OSError as e:
+            logger.warning(f"Failed to refresh cache timestamp: {e}")
+        self._mem_cache[cache_key] = (time.time(), data)
+        logger.info(f"Cached data for {cache_key} not modified upstream")
+    
     def _write_cache(self, cache_key: str, data: Dict) -> None:
         """Write data to cache"""
         if not self.cache_enabled:
@@ -79,33 +377,110 @@ class LiveDataFetcher:
         cache_path = self._get_cache_path(cache_key)
         
         try:
-            with open(cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Cache files are never edited by hand, so they are written compactly
+            if self.cache_format == 'msgpack':
+                payload = msgpack.packb(data, use_bin_type=True)
+            else:
+                payload = _dumps(data, indent=False)
+            _atomic_write(cache_path, payload)
+            self._mem_cache[cache_key] = (time.time(), data)
             logger.info(f"Cached data for {cache_key}")
         except Exception as e:
             logger.warning(f"Failed to write cache: {e}")
     
-    def _make_request(self, url: str, timeout: int = 30, headers: Optional[Dict] = None) -> Optional[Dict]:
-        """Make HTTP request with retry logic"""
-        retry_attempts = self.config.get('data_sources', {}).get('ibm_registry', {}).get('retry_attempts', 3)
+    def _make_request(
+        self,
+        url: str,
+        timeout: int = 30,
+        headers: Optional[Dict] = None,
+        validators: Optional[Dict] = None
+    ) -> Optional[Any]:
+        """Make HTTP request; connection errors and 429/5xx are retried by the session
+        
+        When validators holds an 'etag' and/or 'last_modified' from an earlier
+        response, the GET is conditional and _NOT_MODIFIED is returned on 304.
+        Otherwise validators is updated in place from the new response.
+        """
+        try:
+            logger.info(f"Fetching data from {url}")
+            response = self._session.get(url, timeout=timeout, headers=self._conditional_headers(headers, validators))
+            if response.status_code == 304 and validators:
+                return _NOT_MODIFIED
+            response.raise_for_status()
+            self._update_validators(validators, response)
+            return _loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Request failed for {url}: {e}")
         
-        for attempt in range(retry_attempts):
-            try:
-                logger.info(f"Fetching data from {url} (attempt {attempt + 1}/{retry_attempts})")
-                response = requests.get(url, timeout=timeout, headers=headers or {})
+        return None
+    
+    def _request_items(
+        self,
+        url: str,
+        items_path: str,
+        transform,
+        timeout: int = 30,
+        validators: Optional[Dict] = None
+    ) -> Optional[Any]:
+        """Like _make_request, but return transform(item) for each element of the array at items_path
+        
+        items_path uses ijson prefix syntax (e.g. 'nodes.item'). With ijson installed
+        the body is parsed as it streams in, so the full document is never held in
+        memory; otherwise it is parsed whole and the array looked up by the same path.
+        Either way the result is None, not [], when no item was found, so a payload
+        without the array is never cached as an empty list.
+        """
+        try:
+            logger.info(f"Fetching data from {url}")
+            response = self._session.get(
+                url,
+                timeout=timeout,
+                headers=self._conditional_headers(None, validators),
+                stream=ijson is not None
+            )
+            with response:
+                if response.status_code == 304 and validators:
+                    return _NOT_MODIFIED
                 response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                if attempt < retry_attempts - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                self._update_validators(validators, response)
+                
+                if ijson is not None:
+                    response.raw.decode_content = True
+                    items = [transform(item) for item in ijson.items(response.raw, items_path)]
                 else:
-                    logger.error(f"All retry attempts failed for {url}")
+                    data = _loads(response.content)
+                    for key in items_path.split('.')[:-1]:
+                        data = data.get(key) if isinstance(data, dict) else None
+                    items = [transform(item) for item in data] if isinstance(data, list) else []
+                return items or None
+        except Exception as e:
+            logger.error(f"Request failed for {url}: {e}")
         
         return None
     
-    def fetch_ibm_case_versions(self, component: str) -> Optional[List[str]]:
-        """Fetch available versions for an IBM component from GitHub CASE repository"""
+    @staticmethod
+    def _conditional_headers(headers: Optional[Dict], validators: Optional[Dict]) -> Dict:
+        """Request headers plus If-None-Match / If-Modified-Since from earlier validators"""
+        headers = dict(headers or {})
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+    
+    @staticmethod
+    def _update_validators(validators: Optional[Dict], response) -> None:
+        """Record the validators of a fresh response in place"""
+        if validators is not None:
+            validators['etag'] = response.headers.get('ETag')
+            validators['last_modified'] = response.headers.get('Last-Modified')
+    
+    def fetch_ibm_case_versions(self, component: str, fetched_at: Optional[str] = None) -> Optional[List[str]]:
+        """Fetch available versions for an IBM component from GitHub CASE repository
+        
+        fetched_at stamps a newly cached result (refresh_all_data passes its start time); default now.
+        """
         cache_key = f"ibm_case_{component}"
         
         # Check cache first
@@ -124,24 +499,30 @@ class LiveDataFetcher:
         base_url = github_config.get('ibm_case_repo', '')
         url = f"{base_url}/{case_name}"
         
-        data = self._make_request(url, timeout=github_config.get('timeout', 30))
+        # Revalidate an expired entry instead of downloading the listing again
+        stale = self._read_stale_cache(cache_key)
+        validators = {'etag': stale.get('etag'), 'last_modified': stale.get('last_modified')}
+        data = self._make_request(url, timeout=github_config.get('timeout', 30), validators=validators)
+        
+        if data is _NOT_MODIFIED:
+            self._touch_cache(cache_key, stale)
+            return stale.get('versions', [])
         
         if data and isinstance(data, list):
-            # Extract version directories
-            versions = []
-            for item in data:
-                if item.get('type') == 'dir':
-                    version = item.get('name', '')
-                    # Filter out non-version directories
-                    if version and version[0].isdigit():
-                        versions.append(version)
+            # Extract version directories, filtering out non-version ones
+            versions = [
+                name for item in data
+                if item.get('type') == 'dir' and (name := item.get('name', '')) and name[:1].isdigit()
+            ]
             
-            versions.sort(reverse=True)  # Sort versions in descending order
+            # Sort versions in descending numeric order
+            versions.sort(key=lambda v: tuple(int(x) for x in _VER_RE.findall(v)), reverse=True)
             
             # Cache the result
             cache_data = {
                 'versions': versions,
-                'fetched_at': datetime.now().isoformat()
+                'fetched_at': fetched_at or _utc_now(),
+                **validators
             }
             self._write_cache(cache_key, cache_data)
             
@@ -172,25 +553,9 @@ class LiveDataFetcher:
         case_yaml_url = f"{base_url}/{case_name}/{version}/case.yaml"
         
         try:
-            import requests
-            response = requests.get(case_yaml_url, timeout=30)
+            response = self._session.get(case_yaml_url, timeout=30)
             if response.status_code == 200:
-                # Parse YAML content
-                import yaml
-                case_data = yaml.safe_load(response.text)
-                
-                # Extract relevant information
-                details = {
-                    'case_version': version,
-                    'name': case_data.get('name', case_name),
-                    'description': case_data.get('description', ''),
-                    'version': case_data.get('version', version),
-                    'appVersion': case_data.get('appVersion', ''),
-                    'webPage': case_data.get('webPage', ''),
-                    'licenses': case_data.get('licenses', []),
-                    'supports': case_data.get('supports', {}),
-                    'fetched_at': datetime.now().isoformat()
-                }
+                details = self._parse_case_yaml(response.text, case_name, version)
                 
                 # Cache the result
                 self._write_cache(cache_key, details)
@@ -201,8 +566,138 @@ class LiveDataFetcher:
         
         return None
     
-    def fetch_openshift_versions(self, channel: str = 'stable-4.20') -> Optional[List[Dict]]:
-        """Fetch available OpenShift versions from Red Hat API"""
+    def fetch_all_case_versions_details(self, component: str) -> Optional[Dict[str, Dict]]:
+        """Fetch CASE details for every version of a component
+        
+        One cached Git Trees API call, shared by all components, lists every
+        case.yaml; the files themselves come from raw.githubusercontent.com in
+        parallel, which does not count against the REST API rate limit.
+        Per-version results are cached under the same keys as
+        fetch_case_version_details.
+        """
+        github_config = self.config.get('data_sources', {}).get('github_sources', {})
+        if not github_config.get('enabled', False):
+            return None
+        
+        match = _GITHUB_CONTENTS_RE.match(github_config.get('ibm_case_repo', ''))
+        if not match:
+            logger.error("ibm_case_repo is not a GitHub contents API URL, cannot use the Git Trees API")
+            return None
+        repo_api, repo, case_root = match.groups()
+        
+        component_config = self.config.get('components', {}).get(component, {})
+        case_name = component_config.get('case_name', component)
+        timeout = github_config.get('timeout', 30)
+        
+        case_tree = self._fetch_case_tree(case_root, repo_api, timeout)
+        if case_tree is None:
+            return None
+        paths = case_tree.get(case_name, {})
+        
+        details = {}
+        missing = {}
+        for version, path in paths.items():
+            cached = self._read_cache(f"ibm_case_details_{component}_{version}")
+            if cached:
+                details[version] = cached
+            else:
+                missing[version] = path
+        
+        def fetch_one(version):
+            url = f"https://raw.githubusercontent.com/{repo}/HEAD/{missing[version]}"
+            try:
+                response = self._session.get(url, timeout=timeout)
+                response.raise_for_status()
+                return self._parse_case_yaml(response.text, case_name, version)
+            except Exception as e:
+                logger.error(f"Failed to fetch CASE details for {component} {version}: {e}")
+                return None
+        
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(16, len(missing))) as executor:
+                futures = {executor.submit(fetch_one, version): version for version in missing}
+                for future in as_completed(futures):
+                    version = futures[future]
+                    result = future.result()
+                    if result:
+                        self._write_cache(f"ibm_case_details_{component}_{version}", result)
+                        details[version] = result
+        
+        # Same newest-first order as fetch_ibm_case_versions
+        return {version: details[version] for version in paths if version in details}
+    
+    def _fetch_case_tree(self, case_root: str, repo_api: str, timeout: int) -> Optional[Dict[str, Dict[str, str]]]:
+        """Map every CASE name to {version: repository path of its case.yaml}
+        
+        The recursive tree is repository-wide, so it is requested once for all
+        components (concurrent callers wait for the same request) and cached for
+        the usual max age; an expired entry is revalidated with the tree's ETag.
+        Only the case.yaml paths are cached, not the multi-megabyte tree itself.
+        """
+        cache_key = "ibm_case_tree"
+        with self._case_tree_lock:
+            cached_data = self._read_cache(cache_key)
+            if cached_data:
+                return cached_data.get('cases', {})
+            
+            stale = self._read_stale_cache(cache_key)
+            validators = {'etag': stale.get('etag'), 'last_modified': stale.get('last_modified')}
+            data = self._make_request(
+                f"{repo_api}/git/trees/HEAD?recursive=1", timeout=timeout, validators=validators
+            )
+            
+            if data is _NOT_MODIFIED:
+                self._touch_cache(cache_key, stale)
+                return stale.get('cases', {})
+            
+            if not data or not isinstance(data.get('tree'), list):
+                return None
+            if data.get('truncated'):
+                logger.warning("GitHub tree listing was truncated, some CASE versions may be missing")
+            
+            prefix = f"{case_root}/"
+            cases = {}
+            for item in data['tree']:
+                path = item.get('path', '')
+                if item.get('type') == 'blob' and path.startswith(prefix) and path.endswith('/case.yaml'):
+                    parts = path[len(prefix):].split('/')
+                    if len(parts) == 3 and parts[1][:1].isdigit():
+                        cases.setdefault(parts[0], {})[parts[1]] = path
+            
+            # Newest first, like fetch_ibm_case_versions
+            for case_name, paths in cases.items():
+                cases[case_name] = dict(sorted(
+                    paths.items(), key=lambda kv: tuple(int(x) for x in _VER_RE.findall(kv[0])), reverse=True
+                ))
+            
+            self._write_cache(cache_key, {
+                'cases': cases,
+                'fetched_at': _utc_now(),
+                **validators
+            })
+            return cases
+    
+    def _parse_case_yaml(self, text: str, case_name: str, version: str) -> Dict:
+        """Extract the fields we show from a case.yaml document"""
+        case_data = yaml.load(text, Loader=_YAML_LOADER)
+        
+        return {
+            'case_version': version,
+            'name': case_data.get('name', case_name),
+            'description': case_data.get('description', ''),
+            'version': case_data.get('version', version),
+            'appVersion': case_data.get('appVersion', ''),
+            'webPage': case_data.get('webPage', ''),
+            'licenses': case_data.get('licenses', []),
+            'supports': case_data.get('supports', {}),
+            'fetched_at': _utc_now()
+        }
+    
+    def fetch_openshift_versions(self, channel: str = 'stable-4.20', fetched_at: Optional[str] = None) -> Optional[List[Dict]]:
+        """Fetch available OpenShift versions from Red Hat API
+        
+        fetched_at stamps a newly cached result (refresh_all_data passes its start time); default now.
+        """
         cache_key = f"openshift_{channel}"
         
         # Check cache first
@@ -218,22 +713,32 @@ class LiveDataFetcher:
         base_url = redhat_config.get('openshift_releases', '')
         url = f"{base_url}?channel={channel}"
         
-        data = self._make_request(url, timeout=redhat_config.get('timeout', 30))
+        # Revalidate an expired entry instead of downloading the graph again
+        stale = self._read_stale_cache(cache_key)
+        validators = {'etag': stale.get('etag'), 'last_modified': stale.get('last_modified')}
+        # Only three fields per node are kept, so nodes are consumed as they stream in
+        versions = self._request_items(
+            url,
+            'nodes.item',
+            lambda node: {
+                'version': node.get('version', ''),
+                'release_date': node.get('metadata', {}).get('creationTimestamp', ''),
+                'channel': channel
+            },
+            timeout=redhat_config.get('timeout', 30),
+            validators=validators
+        )
         
-        if data and 'nodes' in data:
-            versions = []
-            for node in data['nodes']:
-                version_info = {
-                    'version': node.get('version', ''),
-                    'release_date': node.get('metadata', {}).get('creationTimestamp', ''),
-                    'channel': channel
-                }
-                versions.append(version_info)
-            
+        if versions is _NOT_MODIFIED:
+            self._touch_cache(cache_key, stale)
+            return stale.get('versions', [])
+        
+        if versions is not None:
             # Cache the result
             cache_data = {
                 'versions': versions,
-                'fetched_at': datetime.now().isoformat()
+                'fetched_at': fetched_at or _utc_now(),
+                **validators
             }
             self._write_cache(cache_key, cache_data)
             
@@ -243,180 +748,11 @@ class LiveDataFetcher:
     
     def fetch_redhat_operators(self) -> Optional[List[Dict]]:
         """Fetch available Red Hat operators from catalog"""
-        cache_key = "redhat_operators"
-        
-        # Check cache first
-        cached_data = self._read_cache(cache_key)
-        if cached_data:
-            return cached_data.get('operators', [])
-        
-        # Fetch from Red Hat Operator Catalog
         redhat_config = self.config.get('data_sources', {}).get('redhat_registry', {})
         if not redhat_config.get('enabled', False):
             return None
         
-        # List of common Red Hat operators for OpenShift
-        operators = [
-            {
-                "name": "Red Hat OpenShift Serverless",
-                "package": "serverless-operator",
-                "catalog": "redhat-operators",
-                "description": "Provides Knative Serving and Eventing capabilities"
-            },
-            {
-                "name": "Red Hat OpenShift Service Mesh",
-                "package": "servicemeshoperator",
-                "catalog": "redhat-operators",
-                "description": "Service mesh based on Istio"
-            },
-            {
-                "name": "Red Hat OpenShift Pipelines",
-                "package": "openshift-pipelines-operator-rh",
-                "catalog": "redhat-operators",
-                "description": "CI/CD solution based on Tekton"
-            },
-            {
-                "name": "Red Hat OpenShift GitOps",
-                "package": "openshift-gitops-operator",
-                "catalog": "redhat-operators",
-                "description": "GitOps solution based on Argo CD"
-            },
-            {
-                "name": "Red Hat OpenShift Logging",
-                "package": "cluster-logging",
-                "catalog": "redhat-operators",
-                "description": "Cluster logging based on Elasticsearch, Fluentd, and Kibana"
-            },
-            {
-                "name": "Red Hat OpenShift Elasticsearch Operator",
-                "package": "elasticsearch-operator",
-                "catalog": "redhat-operators",
-                "description": "Elasticsearch cluster management"
-            },
-            {
-                "name": "Red Hat OpenShift distributed tracing platform",
-                "package": "jaeger-product",
-                "catalog": "redhat-operators",
-                "description": "Distributed tracing based on Jaeger"
-            },
-            {
-                "name": "Red Hat OpenShift distributed tracing data collection",
-                "package": "opentelemetry-product",
-                "catalog": "redhat-operators",
-                "description": "OpenTelemetry Collector for distributed tracing"
-            },
-            {
-                "name": "Kiali Operator",
-                "package": "kiali-ossm",
-                "catalog": "redhat-operators",
-                "description": "Service mesh observability"
-            },
-            {
-                "name": "Red Hat Integration - AMQ Streams",
-                "package": "amq-streams",
-                "catalog": "redhat-operators",
-                "description": "Apache Kafka on OpenShift"
-            },
-            {
-                "name": "Red Hat Integration - AMQ Broker",
-                "package": "amq-broker-rhel8",
-                "catalog": "redhat-operators",
-                "description": "ActiveMQ Artemis messaging broker"
-            },
-            {
-                "name": "Red Hat Integration - 3scale",
-                "package": "3scale-operator",
-                "catalog": "redhat-operators",
-                "description": "API management platform"
-            },
-            {
-                "name": "Red Hat Integration - Camel K",
-                "package": "red-hat-camel-k",
-                "catalog": "redhat-operators",
-                "description": "Lightweight integration framework"
-            },
-            {
-                "name": "Red Hat OpenShift Data Foundation",
-                "package": "odf-operator",
-                "catalog": "redhat-operators",
-                "description": "Software-defined storage solution"
-            },
-            {
-                "name": "Red Hat Advanced Cluster Security",
-                "package": "rhacs-operator",
-                "catalog": "redhat-operators",
-                "description": "Kubernetes-native security platform"
-            },
-            {
-                "name": "Red Hat Quay",
-                "package": "quay-operator",
-                "catalog": "redhat-operators",
-                "description": "Container image registry"
-            },
-            {
-                "name": "Red Hat OpenShift Dev Spaces",
-                "package": "devspaces",
-                "catalog": "redhat-operators",
-                "description": "Cloud development environment"
-            },
-            {
-                "name": "Web Terminal",
-                "package": "web-terminal",
-                "catalog": "redhat-operators",
-                "description": "Terminal access from OpenShift console"
-            },
-            {
-                "name": "Red Hat Compliance Operator",
-                "package": "compliance-operator",
-                "catalog": "redhat-operators",
-                "description": "Compliance scanning and remediation"
-            },
-            {
-                "name": "File Integrity Operator",
-                "package": "file-integrity-operator",
-                "catalog": "redhat-operators",
-                "description": "File integrity monitoring"
-            },
-            {
-                "name": "Red Hat OpenShift Local Storage",
-                "package": "local-storage-operator",
-                "catalog": "redhat-operators",
-                "description": "Local storage management"
-            },
-            {
-                "name": "Red Hat OpenShift Virtualization",
-                "package": "kubevirt-hyperconverged",
-                "catalog": "redhat-operators",
-                "description": "Virtual machine management on OpenShift"
-            },
-            {
-                "name": "Red Hat Cost Management Metrics Operator",
-                "package": "costmanagement-metrics-operator",
-                "catalog": "redhat-operators",
-                "description": "Cost management and optimization"
-            },
-            {
-                "name": "Node Maintenance Operator",
-                "package": "node-maintenance-operator",
-                "catalog": "redhat-operators",
-                "description": "Node maintenance and cordoning"
-            },
-            {
-                "name": "Poison Pill Operator",
-                "package": "poison-pill-manager",
-                "catalog": "redhat-operators",
-                "description": "Node remediation for unhealthy nodes"
-            }
-        ]
-        
-        # Cache the result
-        cache_data = {
-            'operators': operators,
-            'fetched_at': datetime.now().isoformat()
-        }
-        self._write_cache(cache_key, cache_data)
-        
-        return operators
+        return list(_REDHAT_OPERATORS)
     
     def fetch_component_support_matrix(self, component: str, version: str) -> Optional[Dict]:
         """Fetch support matrix for a specific component version"""
@@ -433,37 +769,67 @@ class LiveDataFetcher:
         
         return None
     
-    def get_all_component_versions(self) -> Dict[str, List[str]]:
-        """Get all available versions for all components"""
-        result = {}
-        
-        components = self.config.get('components', {})
-        for component_name in components.keys():
-            versions = self.fetch_ibm_case_versions(component_name)
+    def _fetch_all(self, keys: List[str], fetch, fallback, label: str, cache_key) -> Dict[str, Any]:
+        """Run fetch for every key concurrently, using fallback for keys that yield nothing
+        
+        Keys whose versions are already cached (cache_key(key) names the entry)
+        are answered directly, which is the common case on a warm cache; only
+        the rest go to a thread pool. Those fetches are independent HTTPS
+        requests, so total time is roughly that of the slowest one. The result
+        keeps the order of keys.
+        """
+        def fetch_one(key):
+            try:
+                data = fetch(key)
+            except Exception as e:
+                logger.warning(f"Failed to fetch {label}{key}: {e}")
+                data = None
+            if data:
+                return data
+            # Fallback to local data
+            logger.info(f"Using local data for {label}{key}")
+            return fallback(key)
+        
+        fetched = {}
+        misses = []
+        for key in keys:
+            versions = (self._read_cache(cache_key(key)) or {}).get('versions')
             if versions:
-                result[component_name] = versions
+                fetched[key] = versions
             else:
-                # Fallback to local data
-                logger.info(f"Using local data for {component_name}")
-                result[component_name] = self._get_local_versions(component_name)
+                misses.append(key)
         
-        return result
+        if len(misses) == 1:
+            fetched[misses[0]] = fetch_one(misses[0])
+        elif misses:
+            with ThreadPoolExecutor(max_workers=min(16, len(misses))) as executor:
+                futures = {executor.submit(fetch_one, key): key for key in misses}
+                for future in as_completed(futures):
+                    fetched[futures[future]] = future.result()
+        
+        return {key: fetched[key] for key in keys}
     
-    def get_all_openshift_versions(self) -> Dict[str, List[Dict]]:
+    def get_all_component_versions(self, fetched_at: Optional[str] = None) -> Dict[str, List[str]]:
+        """Get all available versions for all components"""
+        components = list(self.config.get('components', {}).keys())
+        return self._fetch_all(
+            components,
+            lambda component: self.fetch_ibm_case_versions(component, fetched_at),
+            self._get_local_versions,
+            '',
+            lambda component: f"ibm_case_{component}"
+        )
+    
+    def get_all_openshift_versions(self, fetched_at: Optional[str] = None) -> Dict[str, List[Dict]]:
         """Get all available OpenShift versions for all channels"""
-        result = {}
-        
-        channels = self.config.get('openshift', {}).get('channels', [])
-        for channel in channels:
-            versions = self.fetch_openshift_versions(channel)
-            if versions:
-                result[channel] = versions
-            else:
-                # Fallback to local data
-                logger.info(f"Using local data for OpenShift {channel}")
-                result[channel] = self._get_local_openshift_versions(channel)
-        
-        return result
+        channels = list(self.config.get('openshift', {}).get('channels', []))
+        return self._fetch_all(
+            channels,
+            lambda channel: self.fetch_openshift_versions(channel, fetched_at),
+            self._get_local_openshift_versions,
+            'OpenShift ',
+            lambda channel: f"openshift_{channel}"
+        )
     
     def _get_local_versions(self, component: str) -> List[str]:
         """Get versions from local sample-versions.json file"""
@@ -471,9 +837,7 @@ class LiveDataFetcher:
         local_file = fallback_config.get('local_versions_file', 'sample-versions.json')
         
         try:
-            with open(local_file, 'r') as f:
-                data = json.load(f)
-                return data.get(component, [])
+            return self._load_local_file(local_file).get(component, [])
         except Exception as e:
             logger.error(f"Failed to read local versions: {e}")
             return []
@@ -484,42 +848,73 @@ class LiveDataFetcher:
         local_file = fallback_config.get('local_version_file', 'cp4i_version_data.json')
         
         try:
-            with open(local_file, 'r') as f:
-                data = json.load(f)
-                openshift_data = data.get('openshift_versions', {})
-                
-                versions = []
-                for version, info in openshift_data.items():
-                    versions.append({
-                        'version': version,
-                        'release_date': info.get('release_date', ''),
-                        'end_of_support': info.get('end_of_support', ''),
-                        'status': info.get('status', ''),
-                        'is_eus': info.get('is_eus', False),
-                        'channel': channel
-                    })
-                
-                return versions
+            openshift_data = self._load_local_file(local_file).get('openshift_versions', {})
+            
+            versions = []
+            for version, info in openshift_data.items():
+                versions.append({
+                    'version': version,
+                    'release_date': info.get('release_date', ''),
+                    'end_of_support': info.get('end_of_support', ''),
+                    'status': info.get('status', ''),
+                    'is_eus': info.get('is_eus', False),
+                    'channel': channel
+                })
+            
+            return versions
         except Exception as e:
             logger.error(f"Failed to read local OpenShift versions: {e}")
             return []
     
+    def _load_local_file(self, path: str) -> Dict:
+        """Parse a local fallback file once and reuse it for every component/channel"""
+        data = self._local_files.get(path)
+        if data is None:
+            with open(path, 'rb') as f:
+                data = _loads(f.read())
+            self._local_files[path] = data
+        return data
+    
     def refresh_all_data(self) -> Dict[str, Any]:
         """Refresh all data from live sources"""
         logger.info("Refreshing all data from live sources...")
         
-        result = {
-            'components': self.get_all_component_versions(),
-            'openshift': self.get_all_openshift_versions(),
-            'refreshed_at': datetime.now().isoformat()
-        }
+        # Everything fetched during this refresh is stamped with its start time,
+        # passed down explicitly since other threads may be fetching concurrently
+        timestamp = _utc_now()
+        
+        # Component and OpenShift fetches share no state, so both fan-outs run at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            components_future = executor.submit(self.get_all_component_versions, timestamp)
+            openshift_future = executor.submit(self.get_all_openshift_versions, timestamp)
+            result = {
+                'components': components_future.result(),
+                'openshift': openshift_future.result(),
+                'refreshed_at': timestamp
+            }
         
         # Save consolidated data
         consolidated_cache_path = os.path.join(self.cache_dir, 'consolidated_data.json')
+        hash_path = consolidated_cache_path + '.hash'
         try:
-            with open(consolidated_cache_path, 'w') as f:
-                json.dump(result, f, indent=2)
-            logger.info("Consolidated data saved successfully")
+            # refreshed_at changes on every run, so only the data itself is hashed
+            digest = hashlib.blake2b(
+                _dumps({k: v for k, v in result.items() if k != 'refreshed_at'}, indent=False),
+                digest_size=16
+            ).hexdigest()
+            try:
+                with open(hash_path) as f:
+                    unchanged = f.read().strip() == digest
+            except OSError:
+                unchanged = False
+            
+            if unchanged and os.path.exists(consolidated_cache_path):
+                os.utime(consolidated_cache_path, None)
+                logger.info("Consolidated data unchanged, not rewritten")
+            else:
+                _atomic_write(consolidated_cache_path, _dumps(result))
+                _atomic_write(hash_path, digest.encode())
+                logger.info("Consolidated data saved successfully")
         except Exception as e:
             logger.error(f"Failed to save consolidated data: {e}")
         
@@ -527,15 +922,19 @@ class LiveDataFetcher:
     
     def clear_cache(self) -> None:
         """Clear all cached data"""
-        if not self.cache_enabled or not os.path.exists(self.cache_dir):
+        self._mem_cache.clear()
+        if not self.cache_enabled:
             return
         
         try:
-            for filename in os.listdir(self.cache_dir):
-                file_path = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
+            # DirEntry carries the file type from getdents, so no stat per entry
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        os.unlink(entry.path)
             logger.info("Cache cleared successfully")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Failed to clear cache: {e}")
 